@@ -4,8 +4,8 @@ from datetime import datetime
 from dotenv import load_dotenv
 
 from src.order_monitor import OrderMonitor
-from src.trading_order import TradingOrder
-from src.trading_logger import TradingLogger
+from src.trading_order import get_trading_order
+from src.trading_logger import get_trading_logger
 from src.utils.log_manager import LogManager, LogCategory
 
 # 환경 변수 로드
@@ -13,8 +13,8 @@ load_dotenv()
 
 async def main():
     """메인 비동기 함수"""
-    trading_logger = TradingLogger()
-    trading_order = TradingOrder()
+    trading_logger = get_trading_logger()
+    trading_order = get_trading_order()
     order_monitor = OrderMonitor(
         trading_order=trading_order,
         trading_logger=trading_logger,
@@ -6,7 +6,7 @@ from src.trading_executor import TradingExecutor
 from src.discord_notifier import DiscordNotifier
 from src.trading_scheduler import TradingScheduler
 from src.utils.log_manager import LogManager
-from src.trading_logger import TradingLogger
+from src.trading_logger import get_trading_logger
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -43,8 +43,8 @@ def test_trading_scheduler():
         # DiscordNotifier 생성
         discord_notifier = DiscordNotifier(discord_webhook_url, log_manager)
 
-        # TradingLogger 생성
-        trading_logger = TradingLogger(
+        # TradingLogger 생성 (프로세스 전역 공유 인스턴스)
+        trading_logger = get_trading_logger(
             log_manager=log_manager
         )   
 
@@ -1,6 +1,7 @@
 import json
+import time
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, List
 
 import requests
 from requests import Response
@@ -8,6 +9,13 @@ from src.models.market_data import TradeExecutionResult
 from src.utils.log_manager import LogManager, LogCategory
 
 class DiscordNotifier:
+    # Discord 웹훅 메시지 하나에 담을 수 있는 최대 임베드 수
+    MAX_EMBEDS_PER_MESSAGE = 10
+    # 429(rate limit) 응답 시 retry_after만큼 기다린 뒤 재시도하는 최대 횟수
+    MAX_RATE_LIMIT_RETRIES = 3
+    # 재시도 전 한 번에 기다리는 최대 시간 (초) - 서버가 큰 값을 주어도 호출자를 오래 막지 않도록 제한
+    MAX_RETRY_AFTER_SECONDS = 5.0
+    
     def __init__(self, webhook_url: str, log_manager: LogManager):
         """Discord 웹훅을 통해 알림을 보내는 클래스
 
@@ -17,10 +25,18 @@ class DiscordNotifier:
         """
         self.webhook_url = webhook_url
         self.log_manager = log_manager
+        # 웹훅 호출 간 커넥션 재사용
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
 
     def _send_message(self, content: str, embeds: Optional[list] = None) -> Response:
         """Discord로 메시지를 전송합니다.
 
+        429 응답을 받으면 retry_after(초)만큼, 최대 MAX_RETRY_AFTER_SECONDS까지
+        기다린 뒤 재시도합니다. 마지막 시도 이후에는 기다리지 않습니다.
+        대기는 호출한 쓰레드를 막으므로, 매매 루프에서는 스케줄러의 알림 쓰레드를
+        통해 호출해야 합니다.
+
         Args:
             content (str): 메시지 내용
             embeds (Optional[list], optional): Discord 임베드. Defaults to None.
@@ -32,11 +48,20 @@ class DiscordNotifier:
         if embeds:
             data["embeds"] = embeds
 
-        response = requests.post(
-            self.webhook_url,
-            data=json.dumps(data),
-            headers={"Content-Type": "application/json"},
-        )
+        body = json.dumps(data)
+        
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            response = self.session.post(self.webhook_url, data=body)
+            if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                break
+            
+            retry_after = self._retry_after_seconds(response)
+            self.log_manager.log(
+                category=LogCategory.WARNING,
+                message="Discord rate limit, 재시도 대기",
+                data={"retry_after": retry_after}
+            )
+            time.sleep(retry_after)
 
         if response.status_code != 204:
             self.log_manager.log(
@@ -50,6 +75,21 @@ class DiscordNotifier:
         
         return response
 
+    def _retry_after_seconds(self, response: Response) -> float:
+        """429 응답에서 재시도까지 기다릴 시간(초)을 구합니다.
+
+        Retry-After 헤더를 우선 사용하고, 없으면 응답 본문의 retry_after를 사용합니다.
+        값은 0 ~ MAX_RETRY_AFTER_SECONDS 범위로 제한합니다.
+        """
+        try:
+            retry_after = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            try:
+                retry_after = float(response.json().get("retry_after", 1))
+            except (ValueError, TypeError, AttributeError):
+                retry_after = 1.0
+        return min(max(retry_after, 0.0), self.MAX_RETRY_AFTER_SECONDS)
+
     def _format_number(self, value) -> str:
         """숫자를 포맷팅합니다."""
         try:
@@ -190,18 +230,32 @@ RSI 지표:
         Args:
             error_message (str): 에러 메시지
         """
+        self.send_error_notifications([error_message])
+
+    def send_error_notifications(self, error_messages: List[str]) -> None:
+        """여러 에러 메시지를 임베드로 묶어 Discord로 전송합니다.
+
+        메시지 하나에 최대 MAX_EMBEDS_PER_MESSAGE개의 임베드를 담아 요청 수를 줄입니다.
+
+        Args:
+            error_messages (List[str]): 에러 메시지 목록
+        """
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        embed = {
-            "title": "⚠️ 에러 발생",
-            "color": 0xff0000,
-            "description": error_message,
-            "footer": {"text": now}
-        }
-
-        self._send_message("", [embed])
+        embeds = [
+            {
+                "title": "⚠️ 에러 발생",
+                "color": 0xff0000,
+                "description": error_message,
+                "footer": {"text": now}
+            }
+            for error_message in error_messages
+        ]
+
+        for i in range(0, len(embeds), self.MAX_EMBEDS_PER_MESSAGE):
+            self._send_message("", embeds[i:i + self.MAX_EMBEDS_PER_MESSAGE])
         self.log_manager.log(
             category=LogCategory.DISCORD,
             message="에러 알림 전송 완료",
-            data={"error_message": error_message}
+            data={"error_messages": error_messages}
         ) 
\ No newline at end of file
@@ -2,6 +2,7 @@ from dataclasses import dataclass, asdict
 from typing import Literal, Optional, Dict, Any, Union, ClassVar
 from datetime import datetime
 import json
+from src.models.order import OrderSideType, OrderType, OrderResult, Trade
 
 PriceTrendType = Literal["상승", "하락", "횡보"]
 VolumeTrendType = Literal["상승", "하락", "횡보"]
@@ -14,8 +15,6 @@ OverallSignalType = Literal["매수", "매도", "관망"]
 EntryTimingType = Literal["즉시", "대기"]
 ActionType = Literal["매수", "매도", "관망"]
 RiskLevelType = Literal["상", "중", "하"]
-OrderSideType = Literal["bid", "ask", "none"]
-OrderType = Literal["limit", "price", "market", "none"]
 
 @dataclass
 class CurrentPrice:
@@ -261,105 +260,6 @@ class OrderInfo:
         """
         return asdict(self)
 
-@dataclass
-class OrderResult:
-    """주문 실행 결과"""
-    # 공통 필드
-    uuid: str                        # 주문 ID
-    side: OrderSideType             # 주문 방향 ("bid" 또는 "ask")
-    ord_type: OrderType             # 주문 타입
-    state: Literal[                 # 주문 상태
-        'wait',                     # 체결 대기
-        'done',                     # 전체 체결 완료
-        'cancel'                    # 주문 취소
-    ]
-    market: str                     # 마켓 정보
-    created_at: str                 # 주문 생성 시각
-    trades_count: int               # 거래 횟수
-    paid_fee: float                 # 지불된 수수료
-    executed_volume: str            # 체결된 수량
-
-    # 매수 주문일 때 추가되는 필드
-    price: Optional[float] = None        # 주문 가격
-    reserved_fee: Optional[float] = None # 예약된 수수료
-    remaining_fee: Optional[float] = None # 남은 수수료
-    locked: Optional[Union[float, str]] = None  # 잠긴 금액(매수 시 KRW) 또는 수량(매도 시 코인)
-
-    # 매도 주문일 때 추가되는 필드
-    volume: Optional[float] = None          # 주문 수량
-    remaining_volume: Optional[float] = None # 남은 수량
-
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'OrderResult':
-        """딕셔너리로부터 OrderResult 객체 생성
-
-        Args:
-            data (Dict): 주문 결과 데이터 딕셔너리
-
-        Returns:
-            OrderResult: 생성된 OrderResult 객체
-        """
-        # 필수 필드가 없는 경우 기본값 설정
-        required_fields = {
-            'uuid': '',
-            'side': 'none',
-            'ord_type': 'none',
-            'state': 'wait',
-            'market': '',
-            'created_at': datetime.now().isoformat(),
-            'trades_count': 0,
-            'paid_fee': 0.0,
-            'executed_volume': '0'
-        }
-        
-        # 딕셔너리 데이터와 기본값 병합
-        merged_data = {**required_fields, **data}
-        
-        # 숫자 형식 변환
-        if 'price' in merged_data and merged_data['price']:
-            merged_data['price'] = float(merged_data['price'])
-        if 'reserved_fee' in merged_data and merged_data['reserved_fee']:
-            merged_data['reserved_fee'] = float(merged_data['reserved_fee'])
-        if 'volume' in merged_data and merged_data['volume']:
-            merged_data['volume'] = float(merged_data['volume'])
-        if 'remaining_volume' in merged_data and merged_data['remaining_volume']:
-            merged_data['remaining_volume'] = float(merged_data['remaining_volume'])
-        if 'locked' in merged_data and merged_data['locked']:
-            # locked는 매수/매도에 따라 다른 타입 사용
-            if merged_data['side'] == 'bid':
-                merged_data['locked'] = float(merged_data['locked'])
-        
-        return cls(**merged_data)
-
-    @classmethod
-    def from_json(cls, json_str: str) -> 'OrderResult':
-        """JSON 문자열로부터 OrderResult 객체 생성
-
-        Args:
-            json_str (str): 주문 결과 JSON 문자열
-
-        Returns:
-            OrderResult: 생성된 OrderResult 객체
-        """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-
-    def to_dict(self) -> Dict:
-        """OrderResult 객체를 딕셔너리로 변환
-
-        Returns:
-            Dict: 변환된 딕셔너리
-        """
-        return asdict(self)
-
-    def to_json(self) -> str:
-        """OrderResult 객체를 JSON 문자열로 변환
-
-        Returns:
-            str: 변환된 JSON 문자열
-        """
-        return json.dumps(self.to_dict())
-
 @dataclass
 class TradeExecutionResult:
     """매매 실행 결과"""
@@ -1,37 +1,57 @@
-from typing import List, Optional, Dict, Union, Literal
+from typing import Any, List, Optional, Dict, Literal
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from decimal import Decimal
 import json
-from src.models.market_data import OrderSideType, OrderType
 
-@dataclass
+OrderSideType = Literal["bid", "ask", "none"]
+OrderType = Literal["limit", "price", "market", "none"]
+
+_ZERO = Decimal(0)
+
+def _to_decimal(value: Any, default: Optional[Decimal] = None) -> Optional[Decimal]:
+    """값이 있으면 Decimal로 변환하고, 비어 있으면(키 없음, null, 빈 문자열) default를 반환합니다.
+
+    API가 숫자를 문자열로 전달하므로 str을 거쳐 변환해 float 오차 없이 보관합니다.
+    """
+    if value is None or value == '':
+        return default
+    return Decimal(str(value))
+
+@dataclass(slots=True)
 class Trade:
     """주문 체결 정보"""
     market: str           # 마켓의 유일 키
     uuid: str            # 체결의 고유 아이디
-    price: str           # 체결 가격
-    volume: str          # 체결 양
-    funds: str           # 체결된 총 가격
+    price: Decimal       # 체결 가격
+    volume: Decimal      # 체결 양
+    funds: Decimal       # 체결된 총 가격
     side: str            # 체결 종류
     created_at: str      # 체결 시각
 
     @classmethod
-    def from_dict(cls, data: dict) -> Optional['Trade']:
+    def from_dict(cls, data: Dict[str, Any]) -> Optional['Trade']:
         """딕셔너리에서 Trade 객체 생성"""
         try:
-            return cls(
-                market=data.get('market', ''),
-                uuid=data.get('uuid', ''),
-                price=data.get('price', '0'),
-                volume=data.get('volume', '0'),
-                funds=data.get('funds', '0'),
-                side=data.get('side', ''),
-                created_at=data.get('created_at', '')
-            )
+            return _trade_from_dict(data)
         except Exception:
             return None
 
-@dataclass
+def _trade_from_dict(data: Dict[str, Any]) -> Trade:
+    """딕셔너리에서 Trade 객체 생성 (예외 처리 없이 체결 목록 일괄 변환에 사용)"""
+    g = data.get
+    # 필드 선언 순서대로 위치 인자로 전달 (키워드 인자 처리 비용 절감)
+    return Trade(
+        g('market', ''),                     # market
+        g('uuid', ''),                       # uuid
+        _to_decimal(g('price'), _ZERO),      # price
+        _to_decimal(g('volume'), _ZERO),     # volume
+        _to_decimal(g('funds'), _ZERO),      # funds
+        g('side', ''),                       # side
+        g('created_at', '')                  # created_at
+    )
+
+@dataclass(slots=True)
 class OrderResult:
     """주문 실행 결과"""
     # 공통 필드
@@ -46,24 +66,24 @@ class OrderResult:
     market: str                     # 마켓 정보
     created_at: str                 # 주문 생성 시각
     trades_count: int               # 거래 횟수
-    paid_fee: float                 # 지불된 수수료
-    executed_volume: str            # 체결된 수량
+    paid_fee: Decimal               # 지불된 수수료
+    executed_volume: Decimal        # 체결된 수량
 
     # 매수 주문일 때 추가되는 필드
-    price: Optional[float] = None        # 주문 가격
-    reserved_fee: Optional[float] = None # 예약된 수수료
-    remaining_fee: Optional[float] = None # 남은 수수료
-    locked: Optional[Union[float, str]] = None  # 잠긴 금액(매수 시 KRW) 또는 수량(매도 시 코인)
+    price: Optional[Decimal] = None        # 주문 가격
+    reserved_fee: Optional[Decimal] = None # 예약된 수수료
+    remaining_fee: Optional[Decimal] = None # 남은 수수료
+    locked: Optional[Decimal] = None       # 잠긴 금액(매수 시 KRW) 또는 수량(매도 시 코인)
 
     # 매도 주문일 때 추가되는 필드
-    volume: Optional[float] = None          # 주문 수량
-    remaining_volume: Optional[float] = None # 남은 수량
+    volume: Optional[Decimal] = None          # 주문 수량
+    remaining_volume: Optional[Decimal] = None # 남은 수량
 
     # 체결 목록
-    trades: List[Trade] = None
+    trades: Optional[List[Trade]] = None
 
     @classmethod
-    def from_dict(cls, data: Dict) -> Optional['OrderResult']:
+    def from_dict(cls, data: Dict[str, Any]) -> Optional['OrderResult']:
         """딕셔너리로부터 OrderResult 객체 생성
 
         Args:
@@ -73,45 +93,39 @@ class OrderResult:
             Optional[OrderResult]: 생성된 OrderResult 객체
         """
         try:
-            # 필수 필드가 없는 경우 기본값 설정
-            required_fields = {
-                'uuid': '',
-                'side': 'none',
-                'ord_type': 'none',
-                'state': 'wait',
-                'market': '',
-                'created_at': datetime.now().isoformat(),
-                'trades_count': 0,
-                'paid_fee': 0.0,
-                'executed_volume': '0'
-            }
-            
-            # 딕셔너리 데이터와 기본값 병합
-            merged_data = {**required_fields, **data}
-            
-            # 숫자 형식 변환
-            if 'price' in merged_data and merged_data['price']:
-                merged_data['price'] = float(merged_data['price'])
-            if 'reserved_fee' in merged_data and merged_data['reserved_fee']:
-                merged_data['reserved_fee'] = float(merged_data['reserved_fee'])
-            if 'volume' in merged_data and merged_data['volume']:
-                merged_data['volume'] = float(merged_data['volume'])
-            if 'remaining_volume' in merged_data and merged_data['remaining_volume']:
-                merged_data['remaining_volume'] = float(merged_data['remaining_volume'])
-            if 'locked' in merged_data and merged_data['locked']:
-                # locked는 매수/매도에 따라 다른 타입 사용
-                if merged_data['side'] == 'bid':
-                    merged_data['locked'] = float(merged_data['locked'])
+            g = data.get
             
-            # 체결 목록 변환
-            trades = [
-                Trade.from_dict(trade_data) 
-                for trade_data in data.get('trades', [])
-                if trade_data is not None
-            ]
-            merged_data['trades'] = trades
+            # 체결 목록 변환 (대부분 정상이므로 목록 단위로 한 번에 변환하고,
+            # 실패하면 항목별로 다시 변환해 null/잘못된 항목만 건너뜀)
+            trade_items = g('trades') or ()
+            try:
+                trades = list(map(_trade_from_dict, trade_items))
+            except Exception:
+                trades = [
+                    trade
+                    for trade in map(Trade.from_dict, trade_items)
+                    if trade is not None
+                ]
             
-            return cls(**merged_data)
+            # 필드 선언 순서대로 위치 인자로 전달 (키워드 인자 처리 비용 절감)
+            return cls(
+                g('uuid', ''),                                  # uuid
+                g('side', 'none'),                              # side
+                g('ord_type', 'none'),                          # ord_type
+                g('state', 'wait'),                             # state
+                g('market', ''),                                # market
+                data['created_at'] if 'created_at' in data else datetime.now().isoformat(),  # created_at
+                g('trades_count', 0),                           # trades_count
+                _to_decimal(g('paid_fee'), _ZERO),              # paid_fee
+                _to_decimal(g('executed_volume'), _ZERO),       # executed_volume
+                _to_decimal(g('price')),                        # price
+                _to_decimal(g('reserved_fee')),                 # reserved_fee
+                _to_decimal(g('remaining_fee')),                # remaining_fee
+                _to_decimal(g('locked')),                       # locked
+                _to_decimal(g('volume')),                       # volume
+                _to_decimal(g('remaining_volume')),             # remaining_volume
+                trades                                          # trades
+            )
         except Exception:
             return None
 
@@ -145,4 +159,4 @@ class OrderResult:
         Returns:
             str: 변환된 JSON 문자열
         """
-        return json.dumps(self.to_dict()) 
\ No newline at end of file
+        return json.dumps(self.to_dict(), default=str) 
\ No newline at end of file
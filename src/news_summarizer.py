@@ -1,5 +1,7 @@
 from typing import List, Dict, Optional
+import re
 import json
+import orjson
 import requests
 from datetime import datetime
 from pathlib import Path
@@ -7,6 +9,9 @@ from src.news import News
 import os
 from src.utils.log_manager import LogManager, LogCategory
 
+# 응답 앞뒤의 마크다운 코드 펜스 (```json ... ```)
+_FENCE_RE = re.compile(r'\A```(?:json)?|```\Z')
+
 class NewsSummarizer:
     """뉴스 요약 및 감성 분석기 (GPT-4o-mini-2024-07-18 모델 사용)"""
     
@@ -322,7 +327,7 @@ class NewsSummarizer:
             try:
                 # 마크다운 형식의 JSON 문자열 처리
                 json_str = self._parse_json_from_markdown(response["content"])
-                analysis_result = json.loads(json_str)
+                analysis_result = orjson.loads(json_str)
                 analysis_result["success"] = True
                 
                 if self.log_manager:
@@ -399,12 +404,5 @@ class NewsSummarizer:
         Returns:
             dict: 파싱된 JSON 데이터
         """
-        # 1. 마크다운 코드 블록 제거
-        json_str = markdown_str.strip()
-        if json_str.startswith("```json"):
-            json_str = json_str[7:]  # "```json" 제거
-        if json_str.endswith("```"):
-            json_str = json_str[:-3]  # "```" 제거
-        
-        # 2. 문자열 앞뒤의 공백 제거
-        return json_str.strip() 
\ No newline at end of file
+        # 마크다운 코드 블록 제거 후 앞뒤 공백 제거
+        return _FENCE_RE.sub('', markdown_str.strip()).strip() 
\ No newline at end of file
@@ -7,6 +7,7 @@ from src.models.order import OrderResult
 from src.trading_logger import LogManager, LogCategory
 from src.trading_logger import TradingLogger
 from src.trading_executor import TradeExecutionResult
+from src.trading_order import TradingOrder
 
 @dataclass
 class OrderMonitorConfig:
@@ -21,7 +22,7 @@ class OrderMonitor:
     
     def __init__(
         self,
-        trading_order: OrderResult,
+        trading_order: TradingOrder,
         trading_logger: TradingLogger,
         log_manager: Optional[LogManager] = None,
         config: Optional[OrderMonitorConfig] = None
@@ -102,7 +103,7 @@ class OrderMonitor:
         while True:
             try:
                 # 주문 상태 조회
-                order_response = self.trading_order.get_order(order_id)
+                order_response = await self.trading_order.get_order_async(order_id)
                 
                 # 주문 상태별 처리
                 if order_response.state == "done":
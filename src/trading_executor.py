@@ -1,7 +1,7 @@
 from typing import Dict, Optional
 from datetime import datetime
 from src.trading_decision_maker import TradingDecisionMaker
-from src.trading_order import TradingOrder
+from src.trading_order import get_trading_order
 from src.utils.log_manager import LogManager, LogCategory
 from src.models.market_data import (
     TradingDecisionResult, AssetInfo, OrderInfo,
@@ -32,7 +32,8 @@ class TradingExecutor:
             openai_api_key=openai_api_key,
             log_manager=log_manager
         )
-        self.order = TradingOrder(
+        # 프로세스 전역에서 하나의 주문 세션을 공유
+        self.order = get_trading_order(
             api_key=bithumb_api_key,
             secret_key=bithumb_secret_key,
             log_manager=log_manager
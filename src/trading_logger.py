@@ -1,40 +1,156 @@
 import os
 import json
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Any
+from concurrent.futures import ThreadPoolExecutor, wait
+import google_auth_httplib2
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from src.utils.log_manager import LogManager, LogCategory
 from src.models.market_data import TradeExecutionResult
 from src.models.order import OrderResult, Trade
 
 import uuid
 
+# 429/5xx 응답 시 googleapiclient 내부 지수 백오프 재시도 횟수
+_NUM_RETRIES = 5
+
+# 시트별 헤더 정의
+_SHEET_HEADERS = {
+    'Order Request': [
+        'ID',                              # 고유 ID
+        'Timestamp',                       # 타임스탬프
+        'Symbol',                          # 심볼
+        
+        # Order Result 필드
+        'Order UUID',                      # 주문 ID
+        'Order Side',                      # 주문 방향
+        'Order Type',                      # 주문 타입
+        'Order State',                     # 주문 상태
+        'Market',                          # 마켓 정보
+        'Created At',                      # 주문 생성 시각
+        'Trades Count',                    # 거래 횟수
+        'Paid Fee',                        # 지불된 수수료
+        'Executed Volume',                 # 체결된 수량
+        'Order Price',                     # 주문 가격
+        'Reserved Fee',                    # 예약된 수수료
+        'Remaining Fee',                   # 남은 수수료
+        'Locked Amount',                   # 잠긴 금액/수량
+        'Order Volume',                    # 주문 수량
+        'Remaining Volume',                # 남은 수량
+        
+        # TradingDecision 필드
+        'Action',                          # 매매 행동
+        'Entry Price',                     # 진입 가격
+        'Take Profit',                     # 목표가
+        'Stop Loss',                       # 손절가
+        'Confidence',                      # 확신도
+        'Risk Level',                      # 리스크 레벨
+        'Decision Reason',                 # 판단 근거
+        'Next Decision Interval',          # 다음 판단 시간
+        'Next Decision Reason',            # 다음 판단 이유
+        
+        # Market Data 필드
+        'Current Price',                   # 현재가
+        'MA1',                            # 1분 이동평균
+        'MA3',                            # 3분 이동평균
+        'MA5',                            # 5분 이동평균
+        'MA10',                           # 10분 이동평균
+        'MA20',                           # 20분 이동평균
+        'RSI 1m',                         # 1분 RSI
+        'RSI 3m',                         # 3분 RSI
+        'RSI 7m',                         # 7분 RSI
+        'RSI 14m',                        # 14분 RSI
+        'Volatility 3m',                  # 3분 변동성
+        'Volatility 5m',                  # 5분 변동성
+        'Volatility 10m',                 # 10분 변동성
+        'Volatility 15m',                 # 15분 변동성
+        'Price Trend 1m',                 # 1분 가격 추세
+        'Volume Trend 1m',                # 1분 거래량 추세
+        'VWAP 3m',                        # 3분 VWAP
+        'BB Width',                       # 볼린저 밴드 폭
+        'Order Book Ratio',               # 호가 비율
+        'Spread',                         # 스프레드
+        'Premium Rate',                   # 프리미엄
+        'Funding Rate',                   # 펀딩비율
+        'Price Stability',                # 가격 안정성
+        'Candle Body Ratio',              # 캔들 실체 비율
+        'Candle Strength',                # 캔들 강도
+        'New High 5m',                    # 5분 신고가 갱신
+        'New Low 5m'                      # 5분 신저가 갱신
+    ],
+    'Order Response': [
+        'Order UUID',                      # 주문 ID
+        'Timestamp',                       # 타임스탬프
+        'Symbol',                          # 심볼
+        'Order Side',                      # 주문 방향 (bid/ask)
+        'Order Type',                      # 주문 타입
+        'Price',                           # 주문 가격
+        'Order State',                     # 주문 상태
+        'Market',                          # 마켓 정보
+        'Created At',                      # 주문 생성 시각
+        'Volume',                          # 주문 수량
+        'Remaining Volume',                # 남은 수량
+        'Reserved Fee',                    # 예약된 수수료
+        'Remaining Fee',                   # 남은 수수료
+        'Paid Fee',                        # 지불된 수수료
+        'Locked',                          # 잠긴 금액
+        'Executed Volume',                 # 체결된 수량
+        'Trades Count'                     # 체결 횟수
+    ],
+    'Trade Response': [
+        'Trade UUID',                # 체결 고유 ID
+        'Order UUID',                # 주문 ID
+        'Timestamp',                 # 타임스탬프
+        'Symbol',                    # 심볼
+        'Market',                    # 마켓
+        'Price',                     # 체결 가격
+        'Volume',                    # 체결 수량
+        'Funds',                     # 체결 금액
+        'Side',                      # 매수/매도
+        'Created At'                 # 체결 시각
+    ]
+}
+
 class TradingLogger:
     """Google Sheets를 이용한 트레이딩 로거"""
     
-    def __init__(self, log_manager: Optional[LogManager] = None):
+    def __init__(
+        self,
+        log_manager: Optional[LogManager] = None,
+        credentials_path: Optional[str] = None,
+        spreadsheet_id: Optional[str] = None
+    ):
         """
         Args:
             log_manager (LogManager): 로깅을 담당할 LogManager 인스턴스
+            credentials_path (Optional[str]): 구글 서비스 계정 키 파일 경로 (None이면 환경 변수 사용)
+            spreadsheet_id (Optional[str]): 구글 스프레드시트 ID (None이면 환경 변수 사용)
             
         Environment Variables:
             GOOGLE_SHEETS_ID: 구글 스프레드시트 ID
             GOOGLE_CREDENTIALS_PATH: 구글 서비스 계정 키 파일 경로
         """
         self.SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-        self.SPREADSHEET_ID = os.getenv('GOOGLE_SHEETS_ID')  # 스프레드시트 ID
+        self.SPREADSHEET_ID = spreadsheet_id or os.getenv('GOOGLE_SHEETS_ID')  # 스프레드시트 ID
         self.log_manager = log_manager
         
         if not self.SPREADSHEET_ID:
             raise ValueError("GOOGLE_SHEETS_ID 환경 변수가 설정되지 않았습니다.")
         
-        credentials_path = os.getenv('GOOGLE_CREDENTIALS_PATH')
+        credentials_path = credentials_path or os.getenv('GOOGLE_CREDENTIALS_PATH')
         if not credentials_path:
             raise ValueError("GOOGLE_CREDENTIALS_PATH 환경 변수가 설정되지 않았습니다.")
         
         self.service = self._get_sheets_service(credentials_path)
         
+        # 시트별 append를 동시에 보내기 위한 쓰레드 풀
+        # (httplib2.Http는 쓰레드 안전하지 않으므로 워커 쓰레드마다 별도 인스턴스 사용)
+        self._io_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='sheets-io')
+        self._thread_local = threading.local()
+        
         # 시트 이름 정의
         self.SHEETS = {
             'order_request': 'Order Request',  # 주문 기록
@@ -48,11 +164,11 @@ class TradingLogger:
     def _get_sheets_service(self, credentials_path: str):
         """Google Sheets API 서비스 인스턴스를 생성합니다."""
         try:
-            credentials = service_account.Credentials.from_service_account_file(
+            self.credentials = service_account.Credentials.from_service_account_file(
                 credentials_path,
                 scopes=self.SCOPES
             )
-            return build('sheets', 'v4', credentials=credentials)
+            return build('sheets', 'v4', credentials=self.credentials)
         except Exception as e:
             if self.log_manager:
                 self.log_manager.log(
@@ -68,15 +184,18 @@ class TradingLogger:
             # 기존 시트 목록 조회
             sheets = self.service.spreadsheets().get(
                 spreadsheetId=self.SPREADSHEET_ID
-            ).execute().get('sheets', [])
+            ).execute(num_retries=_NUM_RETRIES).get('sheets', [])
             
             existing_sheets = [sheet['properties']['title'] for sheet in sheets]
             
-            # 필요한 시트 생성
-            for sheet_name in self.SHEETS.values():
-                if sheet_name not in existing_sheets:
-                    self._create_sheet(sheet_name)
-                    self._initialize_headers(sheet_name)
+            # 필요한 시트 생성 (누락된 시트를 한 번의 요청으로 생성)
+            missing_sheets = [
+                sheet_name for sheet_name in self.SHEETS.values()
+                if sheet_name not in existing_sheets
+            ]
+            if missing_sheets:
+                self._create_sheets(missing_sheets)
+                self._initialize_headers(missing_sheets)
             
             if self.log_manager:
                 self.log_manager.log(
@@ -93,26 +212,29 @@ class TradingLogger:
                 )
             raise
     
-    def _create_sheet(self, sheet_name: str):
-        """새로운 시트를 생성합니다."""
+    def _create_sheets(self, sheet_names: List[str]):
+        """새로운 시트들을 한 번의 batchUpdate 요청으로 생성합니다."""
         try:
-            request = {
-                'addSheet': {
-                    'properties': {
-                        'title': sheet_name
+            add_sheet_requests = [
+                {
+                    'addSheet': {
+                        'properties': {
+                            'title': sheet_name
+                        }
                     }
                 }
-            }
+                for sheet_name in sheet_names
+            ]
             
             self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.SPREADSHEET_ID,
-                body={'requests': [request]}
-            ).execute()
+                body={'requests': add_sheet_requests}
+            ).execute(num_retries=_NUM_RETRIES)
             
             if self.log_manager:
                 self.log_manager.log(
                     category=LogCategory.SYSTEM,
-                    message=f"시트 생성 완료: {sheet_name}"
+                    message=f"시트 생성 완료: {', '.join(sheet_names)}"
                 )
             
         except Exception as e:
@@ -120,116 +242,46 @@ class TradingLogger:
                 self.log_manager.log(
                     category=LogCategory.ERROR,
                     message="시트 생성 실패",
-                    data={"sheet_name": sheet_name, "error": str(e)}
+                    data={"sheet_names": sheet_names, "error": str(e)}
                 )
             raise
     
-    def _initialize_headers(self, sheet_name: str):
-        """시트의 헤더를 초기화합니다."""
-        headers = {
-            'Order Request': [
-                'ID',                              # 고유 ID
-                'Timestamp',                       # 타임스탬프
-                'Symbol',                          # 심볼
-                
-                # Order Result 필드
-                'Order UUID',                      # 주문 ID
-                'Order Side',                      # 주문 방향
-                'Order Type',                      # 주문 타입
-                'Order State',                     # 주문 상태
-                'Market',                          # 마켓 정보
-                'Created At',                      # 주문 생성 시각
-                'Trades Count',                    # 거래 횟수
-                'Paid Fee',                        # 지불된 수수료
-                'Executed Volume',                 # 체결된 수량
-                'Order Price',                     # 주문 가격
-                'Reserved Fee',                    # 예약된 수수료
-                'Remaining Fee',                   # 남은 수수료
-                'Locked Amount',                   # 잠긴 금액/수량
-                'Order Volume',                    # 주문 수량
-                'Remaining Volume',                # 남은 수량
-                
-                # TradingDecision 필드
-                'Action',                          # 매매 행동
-                'Entry Price',                     # 진입 가격
-                'Take Profit',                     # 목표가
-                'Stop Loss',                       # 손절가
-                'Confidence',                      # 확신도
-                'Risk Level',                      # 리스크 레벨
-                'Decision Reason',                 # 판단 근거
-                'Next Decision Interval',          # 다음 판단 시간
-                'Next Decision Reason',            # 다음 판단 이유
-                
-                # Market Data 필드
-                'Current Price',                   # 현재가
-                'MA1',                            # 1분 이동평균
-                'MA3',                            # 3분 이동평균
-                'MA5',                            # 5분 이동평균
-                'MA10',                           # 10분 이동평균
-                'MA20',                           # 20분 이동평균
-                'RSI 1m',                         # 1분 RSI
-                'RSI 3m',                         # 3분 RSI
-                'RSI 7m',                         # 7분 RSI
-                'RSI 14m',                        # 14분 RSI
-                'Volatility 3m',                  # 3분 변동성
-                'Volatility 5m',                  # 5분 변동성
-                'Volatility 10m',                 # 10분 변동성
-                'Volatility 15m',                 # 15분 변동성
-                'Price Trend 1m',                 # 1분 가격 추세
-                'Volume Trend 1m',                # 1분 거래량 추세
-                'VWAP 3m',                        # 3분 VWAP
-                'BB Width',                       # 볼린저 밴드 폭
-                'Order Book Ratio',               # 호가 비율
-                'Spread',                         # 스프레드
-                'Premium Rate',                   # 프리미엄
-                'Funding Rate',                   # 펀딩비율
-                'Price Stability',                # 가격 안정성
-                'Candle Body Ratio',              # 캔들 실체 비율
-                'Candle Strength',                # 캔들 강도
-                'New High 5m',                    # 5분 신고가 갱신
-                'New Low 5m'                      # 5분 신저가 갱신
-            ],
-            'Order Response': [
-                'Order UUID',                      # 주문 ID
-                'Timestamp',                       # 타임스탬프
-                'Symbol',                          # 심볼
-                'Order Side',                      # 주문 방향 (bid/ask)
-                'Order Type',                      # 주문 타입
-                'Price',                           # 주문 가격
-                'Order State',                     # 주문 상태
-                'Market',                          # 마켓 정보
-                'Created At',                      # 주문 생성 시각
-                'Volume',                          # 주문 수량
-                'Remaining Volume',                # 남은 수량
-                'Reserved Fee',                    # 예약된 수수료
-                'Remaining Fee',                   # 남은 수수료
-                'Paid Fee',                        # 지불된 수수료
-                'Locked',                          # 잠긴 금액
-                'Executed Volume',                 # 체결된 수량
-                'Trades Count'                     # 체결 횟수
-            ],
-            'Trade Response': [
-                'Trade UUID',                # 체결 고유 ID
-                'Order UUID',                # 주문 ID
-                'Timestamp',                 # 타임스탬프
-                'Symbol',                    # 심볼
-                'Market',                    # 마켓
-                'Price',                     # 체결 가격
-                'Volume',                    # 체결 수량
-                'Funds',                     # 체결 금액
-                'Side',                      # 매수/매도
-                'Created At'                 # 체결 시각
-            ]
-        }
+    def _initialize_headers(self, sheet_names: List[str]):
+        """시트들의 헤더를 한 번의 batchUpdate 요청으로 초기화합니다."""
+        data = [
+            {
+                'range': f"{sheet_name}!A1",
+                'values': [_SHEET_HEADERS[sheet_name]]
+            }
+            for sheet_name in sheet_names
+            if sheet_name in _SHEET_HEADERS
+        ]
+        if not data:
+            return
         
-        if sheet_name in headers:
-            values = [headers[sheet_name]]
-            self._update_values(sheet_name, 'A1', values)
+        try:
+            self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.SPREADSHEET_ID,
+                body={
+                    'valueInputOption': 'USER_ENTERED',
+                    'data': data
+                }
+            ).execute(num_retries=_NUM_RETRIES)
+            
             if self.log_manager:
                 self.log_manager.log(
                     category=LogCategory.SYSTEM,
-                    message=f"{sheet_name} 헤더 초기화 완료"
+                    message=f"헤더 초기화 완료: {', '.join(sheet_names)}"
+                )
+            
+        except Exception as e:
+            if self.log_manager:
+                self.log_manager.log(
+                    category=LogCategory.ERROR,
+                    message="헤더 초기화 실패",
+                    data={"sheet_names": sheet_names, "error": str(e)}
                 )
+            raise
     
     def _update_values(self, sheet_name: str, range_: str, values: List[List]):
         """시트의 값을 업데이트합니다."""
@@ -244,7 +296,7 @@ class TradingLogger:
                 range=range_name,
                 valueInputOption='USER_ENTERED',
                 body=body
-            ).execute()
+            ).execute(num_retries=_NUM_RETRIES)
             
         except Exception as e:
             if self.log_manager:
@@ -255,8 +307,25 @@ class TradingLogger:
                 )
             raise
     
-    def _append_values(self, sheet_name: str, values: List[List]):
-        """시트에 새로운 행을 추가합니다."""
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """현재 쓰레드 전용 인증 HTTP 객체를 반환합니다 (쓰레드당 한 번 생성).
+
+        서비스 기본 객체와 같은 소켓 타임아웃이 적용되도록 build_http()로 생성합니다.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=build_http())
+            self._thread_local.http = http
+        return http
+    
+    def _append_values(self, sheet_name: str, values: List[List], http=None):
+        """시트에 새로운 행을 추가합니다.
+        
+        Args:
+            sheet_name (str): 시트 이름
+            values (List[List]): 추가할 행 목록
+            http: 요청에 사용할 HTTP 객체 (None이면 서비스 기본 객체 사용)
+        """
         try:
             range_name = f"{sheet_name}!A:Z"
             body = {
@@ -269,7 +338,7 @@ class TradingLogger:
                 valueInputOption='USER_ENTERED',
                 insertDataOption='INSERT_ROWS',
                 body=body
-            ).execute()
+            ).execute(http=http, num_retries=_NUM_RETRIES)
             
         except Exception as e:
             if self.log_manager:
@@ -280,82 +349,199 @@ class TradingLogger:
                 )
             raise
     
+    def _append_values_bulk(self, rows_per_sheet: Dict[str, List[List]]):
+        """여러 시트에 행을 추가합니다. 시트마다 한 번의 append 요청만 보냅니다.
+        
+        대상 시트가 둘 이상이면 요청을 쓰레드 풀에서 동시에 보내고,
+        모든 요청이 끝날 때까지 기다린 뒤 첫 번째 예외를 다시 발생시킵니다.
+        
+        Args:
+            rows_per_sheet (Dict[str, List[List]]): 시트 이름별 추가할 행 목록 (빈 목록은 건너뜀)
+        """
+        jobs = [(sheet_name, values) for sheet_name, values in rows_per_sheet.items() if values]
+        if len(jobs) == 1:
+            self._append_values(*jobs[0])
+            return
+        
+        futures = [
+            self._io_pool.submit(
+                lambda sheet_name, values: self._append_values(sheet_name, values, self._thread_http()),
+                sheet_name,
+                values
+            )
+            for sheet_name, values in jobs
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+    
+    @staticmethod
+    def _safe_str(value) -> str:
+        """None이나 빈 값을 안전하게 처리합니다."""
+        return str(value) if value is not None else ""
+    
+    def _order_record_row(self, symbol: str, result: TradeExecutionResult, now: str) -> List:
+        """주문 기록 시트의 한 행을 생성합니다."""
+        safe_str = self._safe_str
+        decision = result.decision_result.decision
+        order_result = result.order_result
+        market_data = result.decision_result.analysis.market_data
+        
+        return [
+            str(uuid.uuid4()),                      # ID
+            now,                                    # Timestamp
+            symbol,                                 # Symbol
+            
+            # Order Result
+            order_result.uuid if order_result else "",                    # Order UUID
+            order_result.side if order_result else "",                    # Order Side
+            order_result.ord_type if order_result else "",               # Order Type
+            order_result.state if order_result else "wait",              # Order State
+            order_result.market if order_result else "",                 # Market
+            order_result.created_at if order_result else "",             # Created At
+            safe_str(order_result.trades_count if order_result else 0),  # Trades Count
+            safe_str(order_result.paid_fee if order_result else 0),      # Paid Fee
+            safe_str(order_result.executed_volume if order_result else ""), # Executed Volume
+            safe_str(order_result.price if order_result else ""),        # Order Price
+            safe_str(order_result.reserved_fee if order_result else ""), # Reserved Fee
+            safe_str(order_result.remaining_fee if order_result else ""), # Remaining Fee
+            safe_str(order_result.locked if order_result else ""),       # Locked Amount
+            safe_str(order_result.volume if order_result else ""),       # Order Volume
+            safe_str(order_result.remaining_volume if order_result else ""), # Remaining Volume
+
+            # TradingDecision 데이터
+            decision.action,                        # Action
+            safe_str(decision.entry_price),         # Entry Price
+            safe_str(decision.take_profit),         # Take Profit
+            safe_str(decision.stop_loss),           # Stop Loss
+            safe_str(decision.confidence),          # Confidence
+            decision.risk_level,                    # Risk Level
+            decision.reason,                        # Decision Reason
+            
+            safe_str(decision.next_decision.interval_minutes if decision.next_decision else ""), # Next Decision Interval
+            decision.next_decision.reason if decision.next_decision else "",                     # Next Decision Reason
+            
+            # Market Data
+            safe_str(market_data.current_price),    # Current Price
+            safe_str(market_data.ma1),              # MA1
+            safe_str(market_data.ma3),              # MA3
+            safe_str(market_data.ma5),              # MA5
+            safe_str(market_data.ma10),             # MA10
+            safe_str(market_data.ma20),             # MA20
+            safe_str(market_data.rsi_1),            # RSI 1m
+            safe_str(market_data.rsi_3),            # RSI 3m
+            safe_str(market_data.rsi_7),            # RSI 7m
+            safe_str(market_data.rsi_14),           # RSI 14m
+            safe_str(market_data.volatility_3m),    # Volatility 3m
+            safe_str(market_data.volatility_5m),    # Volatility 5m
+            safe_str(market_data.volatility_10m),   # Volatility 10m
+            safe_str(market_data.volatility_15m),   # Volatility 15m
+            market_data.price_trend_1m,             # Price Trend 1m
+            market_data.volume_trend_1m,            # Volume Trend 1m
+            safe_str(market_data.vwap_3m),          # VWAP 3m
+            safe_str(market_data.bb_width),         # BB Width
+            safe_str(market_data.order_book_ratio), # Order Book Ratio
+            safe_str(market_data.spread),           # Spread
+            safe_str(market_data.premium_rate),     # Premium Rate
+            safe_str(market_data.funding_rate),     # Funding Rate
+            safe_str(market_data.price_stability),  # Price Stability
+            safe_str(market_data.candle_body_ratio), # Candle Body Ratio
+            market_data.candle_strength,            # Candle Strength
+            "Y" if market_data.new_high_5m else "N", # New High 5m
+            "Y" if market_data.new_low_5m else "N"   # New Low 5m
+        ]
+    
+    @staticmethod
+    def _order_response_row(order_result: OrderResult, now: str) -> List:
+        """주문 응답 시트의 한 행을 생성합니다."""
+        return [
+            order_result.uuid,                 # Order UUID
+            now,                              # Timestamp
+            order_result.market.split('-')[1], # Symbol (KRW-BTC에서 BTC 추출)
+            order_result.side,                # Order Side
+            order_result.ord_type,            # Order Type
+            str(order_result.price) if order_result.price else '',  # Price
+            order_result.state,               # Order State
+            order_result.market,              # Market
+            order_result.created_at,          # Created At
+            str(order_result.volume) if order_result.volume else '', # Volume
+            str(order_result.remaining_volume) if order_result.remaining_volume else '', # Remaining Volume
+            str(order_result.reserved_fee) if order_result.reserved_fee else '',   # Reserved Fee
+            str(order_result.remaining_fee) if order_result.remaining_fee else '',  # Remaining Fee
+            str(order_result.paid_fee),       # Paid Fee
+            str(order_result.locked) if order_result.locked else '',  # Locked
+            str(order_result.executed_volume), # Executed Volume
+            order_result.trades_count         # Trades Count
+        ]
+    
+    @staticmethod
+    def _trade_response_row(trade: Trade, order_id: str, now: str) -> List:
+        """체결 응답 시트의 한 행을 생성합니다."""
+        return [
+            trade.uuid,                 # Trade UUID    
+            order_id,                   # Order ID
+            now,                        # Timestamp
+            trade.market.split('-')[1], # Symbol (KRW-BTC에서 BTC 추출)
+            trade.market,               # Trade Market
+            str(trade.price),           # Trade Price
+            str(trade.volume),          # Trade Volume
+            str(trade.funds),           # Trade Funds
+            trade.side,                 # Trade Side
+            trade.created_at            # Trade Created At
+        ]
+    
+    def log_execution_result(self, symbol: str, result: TradeExecutionResult):
+        """매매 실행 결과(주문 기록, 주문 응답, 체결 내역)를 한 번에 저장합니다.
+        
+        log_order_record와 log_order_response를 차례로 호출하는 것과 같은 행을
+        기록하지만, 체결 건수와 관계없이 시트별 한 번씩(최대 3회)만 요청합니다.
+        
+        Args:
+            symbol (str): 매매 심볼
+            result (TradeExecutionResult): 매매 실행 결과 (order_result 필수)
+        """
+        try:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            order_result = result.order_result
+            
+            self._append_values_bulk({
+                self.SHEETS['order_request']: [self._order_record_row(symbol, result, now)],
+                self.SHEETS['order_response']: [self._order_response_row(order_result, now)],
+                self.SHEETS['trade_response']: [
+                    self._trade_response_row(trade, order_result.uuid, now)
+                    for trade in order_result.trades or ()
+                ]
+            })
+            
+            if self.log_manager:
+                self.log_manager.log(
+                    category=LogCategory.TRADING,
+                    message=f"매매 기록 저장 완료: {symbol}",
+                    data={
+                        "symbol": symbol,
+                        "action": result.decision_result.decision.action,
+                        "order_id": order_result.uuid,
+                        "state": order_result.state,
+                        "trades_count": len(order_result.trades) if order_result.trades else 0
+                    }
+                )
+            
+        except Exception as e:
+            if self.log_manager:
+                self.log_manager.log(
+                    category=LogCategory.ERROR,
+                    message="매매 기록 저장 실패",
+                    data={"symbol": symbol, "error": str(e)}
+                )
+            raise
+    
     def log_order_record(self, symbol: str, result: TradeExecutionResult):
         """주문 기록을 저장합니다."""
         try:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             decision = result.decision_result.decision
-            analysis = result.decision_result.analysis
             order_result = result.order_result
-            market_data = analysis.market_data
-            
-            def safe_str(value) -> str:
-                """None이나 빈 값을 안전하게 처리합니다."""
-                return str(value) if value is not None else ""
-            
-            values = [[
-                str(uuid.uuid4()),                      # ID
-                now,                                    # Timestamp
-                symbol,                                 # Symbol
-                
-                # Order Result
-                order_result.uuid if order_result else "",                    # Order UUID
-                order_result.side if order_result else "",                    # Order Side
-                order_result.ord_type if order_result else "",               # Order Type
-                order_result.state if order_result else "wait",              # Order State
-                order_result.market if order_result else "",                 # Market
-                order_result.created_at if order_result else "",             # Created At
-                safe_str(order_result.trades_count if order_result else 0),  # Trades Count
-                safe_str(order_result.paid_fee if order_result else 0),      # Paid Fee
-                safe_str(order_result.executed_volume if order_result else ""), # Executed Volume
-                safe_str(order_result.price if order_result else ""),        # Order Price
-                safe_str(order_result.reserved_fee if order_result else ""), # Reserved Fee
-                safe_str(order_result.remaining_fee if order_result else ""), # Remaining Fee
-                safe_str(order_result.locked if order_result else ""),       # Locked Amount
-                safe_str(order_result.volume if order_result else ""),       # Order Volume
-                safe_str(order_result.remaining_volume if order_result else ""), # Remaining Volume
-
-                # TradingDecision 데이터
-                decision.action,                        # Action
-                safe_str(decision.entry_price),         # Entry Price
-                safe_str(decision.take_profit),         # Take Profit
-                safe_str(decision.stop_loss),           # Stop Loss
-                safe_str(decision.confidence),          # Confidence
-                decision.risk_level,                    # Risk Level
-                decision.reason,                        # Decision Reason
-                
-                safe_str(decision.next_decision.interval_minutes if decision.next_decision else ""), # Next Decision Interval
-                decision.next_decision.reason if decision.next_decision else "",                     # Next Decision Reason
-                
-                # Market Data
-                safe_str(market_data.current_price),    # Current Price
-                safe_str(market_data.ma1),              # MA1
-                safe_str(market_data.ma3),              # MA3
-                safe_str(market_data.ma5),              # MA5
-                safe_str(market_data.ma10),             # MA10
-                safe_str(market_data.ma20),             # MA20
-                safe_str(market_data.rsi_1),            # RSI 1m
-                safe_str(market_data.rsi_3),            # RSI 3m
-                safe_str(market_data.rsi_7),            # RSI 7m
-                safe_str(market_data.rsi_14),           # RSI 14m
-                safe_str(market_data.volatility_3m),    # Volatility 3m
-                safe_str(market_data.volatility_5m),    # Volatility 5m
-                safe_str(market_data.volatility_10m),   # Volatility 10m
-                safe_str(market_data.volatility_15m),   # Volatility 15m
-                market_data.price_trend_1m,             # Price Trend 1m
-                market_data.volume_trend_1m,            # Volume Trend 1m
-                safe_str(market_data.vwap_3m),          # VWAP 3m
-                safe_str(market_data.bb_width),         # BB Width
-                safe_str(market_data.order_book_ratio), # Order Book Ratio
-                safe_str(market_data.spread),           # Spread
-                safe_str(market_data.premium_rate),     # Premium Rate
-                safe_str(market_data.funding_rate),     # Funding Rate
-                safe_str(market_data.price_stability),  # Price Stability
-                safe_str(market_data.candle_body_ratio), # Candle Body Ratio
-                market_data.candle_strength,            # Candle Strength
-                "Y" if market_data.new_high_5m else "N", # New High 5m
-                "Y" if market_data.new_low_5m else "N"   # New Low 5m
-            ]]
+            values = [self._order_record_row(symbol, result, now)]
             
             self._append_values(self.SHEETS['order_request'], values)
             
@@ -400,7 +586,7 @@ class TradingLogger:
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=self.SPREADSHEET_ID,
                 range=range_name
-            ).execute()
+            ).execute(num_retries=_NUM_RETRIES)
             
             values = result.get('values', [])
             if not values:
@@ -463,7 +649,7 @@ class TradingLogger:
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=self.SPREADSHEET_ID,
                 range=range_name
-            ).execute()
+            ).execute(num_retries=_NUM_RETRIES)
             
             values = result.get('values', [])
             if not values:
@@ -529,9 +715,14 @@ class TradingLogger:
             response = self.service.spreadsheets().values().batchUpdate(
                 spreadsheetId=self.SPREADSHEET_ID,
                 body=body
-            ).execute()
+            ).execute(num_retries=_NUM_RETRIES)
 
-            print(response)
+            if self.log_manager:
+                self.log_manager.log(
+                    category=LogCategory.TRADING,
+                    message="매매 기록 수정 완료",
+                    data={"updated_cells": response.get('totalUpdatedCells', 0)}
+                )
             
         except Exception as e:
             if self.log_manager:
@@ -556,31 +747,14 @@ class TradingLogger:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             symbol = order_result.market.split('-')[1]  # KRW-BTC에서 BTC 추출
             
-            values = [[
-                order_result.uuid,                 # Order UUID
-                now,                              # Timestamp
-                symbol,                           # Symbol
-                order_result.side,                # Order Side
-                order_result.ord_type,            # Order Type
-                str(order_result.price) if order_result.price else '',  # Price
-                order_result.state,               # Order State
-                order_result.market,              # Market
-                order_result.created_at,          # Created At
-                str(order_result.volume) if order_result.volume else '', # Volume
-                str(order_result.remaining_volume) if order_result.remaining_volume else '', # Remaining Volume
-                str(order_result.reserved_fee) if order_result.reserved_fee else '',   # Reserved Fee
-                str(order_result.remaining_fee) if order_result.remaining_fee else '',  # Remaining Fee
-                str(order_result.paid_fee),       # Paid Fee
-                str(order_result.locked) if order_result.locked else '',  # Locked
-                order_result.executed_volume,     # Executed Volume
-                order_result.trades_count         # Trades Count
-            ]]
-                    
-            self._append_values(self.SHEETS['order_response'], values)
-
-            if order_result.trades:
-                for trade in order_result.trades:
-                    self.log_trade_response(trade, order_result.uuid)
+            # 주문 응답 행과 체결 행을 시트별 한 번의 요청으로 추가
+            self._append_values_bulk({
+                self.SHEETS['order_response']: [self._order_response_row(order_result, now)],
+                self.SHEETS['trade_response']: [
+                    self._trade_response_row(trade, order_result.uuid, now)
+                    for trade in order_result.trades or ()
+                ]
+            })
             
             if self.log_manager:
                 self.log_manager.log(
@@ -612,20 +786,7 @@ class TradingLogger:
         """
         try:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            symbol = trade.market.split('-')[1]  # KRW-BTC에서 BTC 추출
-            
-            values = [[
-                trade.uuid,                 # Trade UUID    
-                order_id,                   # Order ID
-                now,                        # Timestamp
-                symbol,                     # Symbol
-                trade.market,               # Trade Market
-                trade.price,                # Trade Price
-                trade.volume,               # Trade Volume
-                trade.funds,                # Trade Funds
-                trade.side,                 # Trade Side
-                trade.created_at            # Trade Created At
-            ]]
+            values = [self._trade_response_row(trade, order_id, now)]
             
             self._append_values(self.SHEETS['trade_response'], values)
             
@@ -636,4 +797,35 @@ class TradingLogger:
                     message="체결 응답 저장 실패",
                     data={"error": str(e)}
                 )
-            raise 
\ No newline at end of file
+            raise
+
+_logger_instance: Optional[TradingLogger] = None
+_logger_instance_lock = threading.Lock()
+
+def get_trading_logger(
+    log_manager: Optional[LogManager] = None,
+    credentials_path: Optional[str] = None,
+    spreadsheet_id: Optional[str] = None
+) -> TradingLogger:
+    """프로세스 전역에서 공유하는 TradingLogger 인스턴스를 반환합니다.
+
+    최초 호출 시에만 인증 정보 로드와 시트 초기화를 수행하며,
+    이후 호출의 인자는 무시됩니다.
+
+    Args:
+        log_manager (Optional[LogManager]): 로깅을 담당할 LogManager 인스턴스
+        credentials_path (Optional[str]): 구글 서비스 계정 키 파일 경로 (None이면 환경 변수 사용)
+        spreadsheet_id (Optional[str]): 구글 스프레드시트 ID (None이면 환경 변수 사용)
+
+    Returns:
+        TradingLogger: 공유 TradingLogger 인스턴스
+    """
+    global _logger_instance
+    with _logger_instance_lock:
+        if _logger_instance is None:
+            _logger_instance = TradingLogger(
+                log_manager=log_manager,
+                credentials_path=credentials_path,
+                spreadsheet_id=spreadsheet_id
+            )
+        return _logger_instance
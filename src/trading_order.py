@@ -1,37 +1,98 @@
 import os
-import json
-import uuid
+import copy
 import time
-import jwt
+import asyncio
+import hmac
+import base64
 import hashlib
+import itertools
 import logging
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from urllib.parse import urlencode
-from typing import Dict, Optional, Union, Literal, List
+from urllib.parse import urlencode, quote_plus
+from typing import Any, Dict, Optional, Union, Literal, List, Tuple
 from src.utils.log_manager import LogManager, LogCategory
 from src.models.market_data import OrderResult, OrderSideType, OrderType, OrderInfo
-from src.models.order import Trade
+
+def _b64url(data: bytes) -> bytes:
+    """패딩 없는 base64url 인코딩 (JWT 세그먼트 형식)"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+# HS256 JWT 헤더 세그먼트 (모든 요청에서 동일하므로 한 번만 인코딩)
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+# 공백 등 특수문자가 들어오지 않는 주문 파라미터 키 (빠른 쿼리 인코딩 대상)
+_FAST_QS_KEYS = frozenset(('market', 'side', 'ord_type', 'price', 'volume', 'uuid'))
+
+def _encode_query(params: Dict[str, Any]) -> bytes:
+    """서명용 쿼리 문자열을 생성합니다.
+
+    모든 키가 _FAST_QS_KEYS에 속하면 urlencode를 거치지 않고 직접 조립합니다.
+    서버가 같은 순서로 해시를 검증하므로 파라미터 순서는 그대로 유지합니다.
+    """
+    if _FAST_QS_KEYS.issuperset(params):
+        # urlencode와 같은 quote_plus 규칙을 써야 서버가 계산하는 해시와 일치함
+        return '&'.join(
+            f"{key}={quote_plus(str(value), safe='')}"
+            for key, value in params.items()
+        ).encode()
+    return urlencode(params).encode()
 
 class TradingOrder:
     """주문 처리를 담당하는 클래스"""
     
+    # API 엔드포인트 경로
+    _ENDPOINTS = {
+        'chance': '/v1/orders/chance',
+        'create': '/v1/orders',
+        'order': '/v1/order',
+        'cancel': '/trade/cancel'
+    }
+    
+    # 주문 가능 정보 캐시 유지 시간 (초)
+    CHANCE_CACHE_TTL = 60
+    
     def __init__(self, api_key: str = None, secret_key: str = None, log_manager: Optional[LogManager] = None):
         """
         Args:
             api_key (str, optional): Bithumb API 키
             secret_key (str, optional): Bithumb Secret 키
             log_manager (Optional[LogManager]): 로그 매니저 (선택사항)
+
+        Raises:
+            ValueError: Secret 키가 인자와 환경 변수 어디에도 없는 경우
         """
         self.api_key = api_key or os.getenv('BITHUMB_API_KEY')
         self.secret_key = secret_key or os.getenv('BITHUMB_SECRET_KEY')
+        # 빈 키로 서명하면 모든 요청이 401로 실패하므로 생성 시점에 바로 알린다
+        if not self.secret_key:
+            raise ValueError("BITHUMB_SECRET_KEY 환경 변수가 설정되지 않았습니다.")
+        self._secret_bytes = self.secret_key.encode()
+        self._nonce_seq = itertools.count(1)  # 요청별 nonce 일련번호
+        self._chance_cache: Dict[str, Tuple[float, Dict]] = {}  # 심볼별 (만료 시각, 주문 가능 정보)
         self.base_url = "https://api.bithumb.com"
+        self._urls = {name: self.base_url + path for name, path in self._ENDPOINTS.items()}
         self.log_manager = log_manager
         
+        # 연결 재사용(keep-alive)을 위한 HTTP 세션
+        # 재시도는 게이트웨이 오류(502/503/504)에 한해 멱등 메서드(GET 등)에만 적용됨
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+        
         # 로깅 설정
         self.logger = logging.getLogger(__name__)
         
-    def _create_auth_token(self, params: Dict) -> str:
+    def _create_auth_token(self, params: Dict[str, Any]) -> str:
         """인증 토큰 생성
         
         Args:
@@ -40,49 +101,94 @@ class TradingOrder:
         Returns:
             str: 인증 토큰
         """
-        query = urlencode(params).encode()
-        hash = hashlib.sha512()
-        hash.update(query)
-        query_hash = hash.hexdigest()
+        query_hash = hashlib.sha512(_encode_query(params)).hexdigest()
         
         payload = {
             'access_key': self.api_key,
-            'nonce': str(uuid.uuid4()),
+            'nonce': f"{time.time_ns()}-{next(self._nonce_seq)}",  # 고유성만 요구되므로 난수 대신 시각+일련번호 사용
             'timestamp': round(time.time() * 1000),
             'query_hash': query_hash,
             'query_hash_alg': 'SHA512'
         }
         
-        jwt_token = jwt.encode(payload, self.secret_key)
-        return f'Bearer {jwt_token}'
+        # HS256 서명을 직접 수행 (헤더 세그먼트와 키 바이트는 미리 준비됨)
+        signing_input = _JWT_HEADER_B64 + b'.' + _b64url(orjson.dumps(payload))
+        signature = _b64url(hmac.new(self._secret_bytes, signing_input, hashlib.sha256).digest())
+        return f'Bearer {(signing_input + b"." + signature).decode()}'
+        
+    def _auth_headers(self, params: Dict[str, Any]) -> Dict[str, str]:
+        """요청별 헤더 생성
+
+        Content-Type 등 고정 헤더는 세션에 설정되어 있으므로
+        요청마다 달라지는 Authorization 헤더만 담습니다.
+        
+        Args:
+            params (Dict): API 요청 파라미터
+            
+        Returns:
+            Dict[str, str]: 요청 헤더
+        """
+        return {'Authorization': self._create_auth_token(params)}
+        
+    def _log_enabled(self, category: str) -> bool:
+        """로그 매니저가 있고 해당 카테고리가 기록 대상인지 확인합니다."""
+        return self.log_manager is not None and self.log_manager.is_enabled(category)
+        
+    def _request_json(self, method: str, endpoint: str, params: Dict[str, Any]) -> Any:
+        """인증 헤더를 붙여 API를 호출하고 JSON 응답을 디코딩합니다.
+        
+        GET은 params를 쿼리스트링으로, POST는 JSON 본문으로 전송합니다.
+        예외는 잡지 않고 호출자에게 그대로 전달합니다.
+        
+        Args:
+            method (str): 'GET' 또는 'POST'
+            endpoint (str): 요청 URL
+            params (Dict): API 요청 파라미터
+            
+        Returns:
+            Any: 디코딩된 응답 본문
+            
+        Raises:
+            requests.exceptions.RequestException: 네트워크 오류 또는 HTTP 오류 상태
+        """
+        headers = self._auth_headers(params)
+        if method == 'GET':
+            response = self.session.get(endpoint, params=params, headers=headers)
+        else:
+            response = self.session.post(endpoint, data=orjson.dumps(params), headers=headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+        
+    def close(self):
+        """HTTP 세션을 닫고 커넥션 풀을 정리합니다."""
+        self.session.close()
         
     def get_order_chance(self, symbol: str) -> Dict:
         """주문 가능 정보 조회
         
+        성공한 응답은 CHANCE_CACHE_TTL초 동안 캐시되므로, 응답에 포함된
+        계좌 잔고는 최대 그 시간만큼 이전 값일 수 있습니다.
+        최신 값이 필요하면 invalidate_chance()를 먼저 호출하세요.
+        이 인스턴스로 주문을 생성하거나 취소하면 해당 심볼의 캐시는 자동으로 비워집니다.
+        
         Args:
             symbol (str): 심볼 (예: 'BTC')
             
         Returns:
-            Dict: 주문 가능 정보를 담은 딕셔너리
+            Dict: 주문 가능 정보를 담은 딕셔너리 (호출자가 수정해도 캐시에 영향 없는 복사본)
         """
-        endpoint = f"{self.base_url}/v1/orders/chance"
+        cached = self._chance_cache.get(symbol)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+        
         param = {
             'market': f'KRW-{symbol}'
         }
         
-        authorization_token = self._create_auth_token(param)
-        headers = {
-            'Authorization': authorization_token
-        }
-        
         try:
-            # Call API
-            response = requests.get(endpoint, params=param, headers=headers)
-            response.raise_for_status()
-            return response.json()
-            
+            chance = self._request_json('GET', self._urls['chance'], param)
         except Exception as e:
-            if self.log_manager:
+            if self._log_enabled(LogCategory.ERROR):
                 self.log_manager.log(
                     category=LogCategory.ERROR,
                     message=f"주문 가능 정보 조회 실패",
@@ -90,6 +196,20 @@ class TradingOrder:
                 )
             return {}
             
+        self._chance_cache[symbol] = (time.monotonic() + self.CHANCE_CACHE_TTL, chance)
+        return copy.deepcopy(chance)
+            
+    def invalidate_chance(self, symbol: Optional[str] = None):
+        """주문 가능 정보 캐시를 비웁니다.
+        
+        Args:
+            symbol (Optional[str]): 비울 심볼. None이면 전체 캐시를 비웁니다.
+        """
+        if symbol is None:
+            self._chance_cache.clear()
+        else:
+            self._chance_cache.pop(symbol, None)
+            
     def create_order(
         self,
         symbol: str,
@@ -107,51 +227,31 @@ class TradingOrder:
         Raises:
             Exception: API 호출 실패 시 발생
         """
+        # API 요청 준비
+        params = {
+            'market': f'KRW-{symbol}',
+            'side': order_info.side,
+            'ord_type': order_info.order_type
+        }
+        # 0.0도 유효한 값이므로 None 여부로만 판단
+        params.update({
+            key: value
+            for key, value in (('price', order_info.price), ('volume', order_info.volume))
+            if value is not None
+        })
+        
         try:
-            # API 요청 준비
-            endpoint = f"{self.base_url}/v1/orders"
-            params = {
-                'market': f'KRW-{symbol}',
-                'side': order_info.side,
-                'ord_type': order_info.order_type
-            }
-            
-            if order_info.price:
-                params['price'] = order_info.price
-            if order_info.volume:
-                params['volume'] = order_info.volume
-            
-            # API 호출
-            headers = {
-                'Authorization': self._create_auth_token(params),
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.post(endpoint, data=json.dumps(params), headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            data = self._request_json('POST', self._urls['create'], params)
             
             if not data or 'error' in data:
                 raise Exception(f"API Error: {data.get('error', {}).get('message', 'Unknown error')}")
             
             # 주문 결과 생성
             order_result = OrderResult.from_dict(data)
-            
-            # 주문 결과 로깅
-            if self.log_manager:
-                self.log_manager.log(
-                    category=LogCategory.TRADING,
-                    message=f"{symbol} {order_info.side} 주문 {'완료' if order_result.state == 'done' else '접수'}",
-                    data={
-                        "symbol": symbol,
-                        "order_result": order_result.to_dict()
-                    }
-                )
-            
-            return order_result
-            
+            if order_result is None:
+                raise Exception("API Error: 주문 결과 파싱 실패")
         except Exception as e:
-            if self.log_manager:
+            if self._log_enabled(LogCategory.ERROR):
                 self.log_manager.log(
                     category=LogCategory.ERROR,
                     message=f"{symbol} {order_info.side} 주문 실패",
@@ -162,6 +262,22 @@ class TradingOrder:
                 )
             raise
             
+        # 주문으로 잔고가 바뀌었으므로 캐시된 주문 가능 정보 폐기
+        self.invalidate_chance(symbol)
+            
+        # 주문 결과 로깅
+        if self._log_enabled(LogCategory.TRADING):
+            self.log_manager.log(
+                category=LogCategory.TRADING,
+                message=f"{symbol} {order_info.side} 주문 {'완료' if order_result.state == 'done' else '접수'}",
+                data={
+                    "symbol": symbol,
+                    "order_result": order_result.to_dict()
+                }
+            )
+        
+        return order_result
+            
     def get_order(self, order_id: str) -> OrderResult:
         """개별 주문 조회
         
@@ -172,16 +288,12 @@ class TradingOrder:
         Returns:
             Optional[OrderResult]: 주문 정보를 담은 OrderResult 객체 또는 None
         """
-        endpoint = f"{self.base_url}/v1/order"
+        endpoint = self._urls['order']
         params = {
             'uuid': order_id
         }
         
-        headers = {
-            'Authorization': self._create_auth_token(params)
-        }
-        
-        if self.log_manager:
+        if self._log_enabled(LogCategory.API):
             self.log_manager.log(
                 category=LogCategory.API,
                 message="빗썸 API: 주문 조회 요청",
@@ -192,24 +304,9 @@ class TradingOrder:
             )
         
         try:
-            response = requests.get(endpoint, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            order_result = OrderResult.from_dict(data)
-                
-            if self.log_manager:
-                self.log_manager.log(
-                    category=LogCategory.API,
-                    message="빗썸 API: 주문 조회 성공",
-                    data={
-                        "order_id": order_id,
-                        "response_status": response.status_code,
-                        "order_result": order_result
-                    }
-                )
-            return order_result
+            order_result = OrderResult.from_dict(self._request_json('GET', endpoint, params))
         except requests.exceptions.RequestException as e:
-            if self.log_manager:
+            if self._log_enabled(LogCategory.ERROR):
                 self.log_manager.log(
                     category=LogCategory.ERROR,
                     message="빗썸 API: 주문 조회 네트워크 오류",
@@ -221,7 +318,7 @@ class TradingOrder:
                 )
             raise
         except Exception as e:
-            if self.log_manager:
+            if self._log_enabled(LogCategory.ERROR):
                 self.log_manager.log(
                     category=LogCategory.ERROR,
                     message="빗썸 API: 주문 조회 중 예외 발생",
@@ -233,6 +330,17 @@ class TradingOrder:
                 )
             raise
             
+        if self._log_enabled(LogCategory.API):
+            self.log_manager.log(
+                category=LogCategory.API,
+                message="빗썸 API: 주문 조회 성공",
+                data={
+                    "order_id": order_id,
+                    "order_result": order_result
+                }
+            )
+        return order_result
+            
     def cancel_order(self, symbol: str, order_id: str) -> Dict:
         """주문 취소
         
@@ -243,39 +351,78 @@ class TradingOrder:
         Returns:
             Dict: 취소 결과를 담은 딕셔너리
         """
-        endpoint = f"{self.base_url}/trade/cancel"
         params = {
             'order_currency': symbol,
             'order_id': order_id,
             'type': 'bid'  # 또는 'ask', 취소할 주문의 종류에 따라
         }
         
-        headers = {
-            'Authorization': self._create_auth_token(params),
-            'Content-Type': 'application/json'
-        }
-        
         try:
-            response = requests.post(endpoint, data=json.dumps(params), headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get('status') == '0000':
-                return data.get('data', {})
-            else:
-                if self.log_manager:
-                    self.log_manager.log(
-                        category=LogCategory.ERROR,
-                        message="주문 취소 실패",
-                        data={"message": data.get('message'), "symbol": symbol, "order_id": order_id}
-                    )
-                return {}
-                
+            data = self._request_json('POST', self._urls['cancel'], params)
         except Exception as e:
-            if self.log_manager:
+            if self._log_enabled(LogCategory.ERROR):
                 self.log_manager.log(
                     category=LogCategory.ERROR,
                     message="주문 취소 중 오류 발생",
                     data={"error": str(e), "symbol": symbol, "order_id": order_id}
                 )
-            return {} 
\ No newline at end of file
+            return {}
+            
+        if data.get('status') == '0000':
+            # 취소로 잠긴 잔고가 풀렸으므로 캐시된 주문 가능 정보 폐기
+            self.invalidate_chance(symbol)
+            return data.get('data', {})
+        
+        if self._log_enabled(LogCategory.ERROR):
+            self.log_manager.log(
+                category=LogCategory.ERROR,
+                message="주문 취소 실패",
+                data={"message": data.get('message'), "symbol": symbol, "order_id": order_id}
+            )
+        return {}
+            
+    async def get_order_chance_async(self, symbol: str) -> Dict:
+        """get_order_chance의 비동기 버전 (워커 쓰레드에서 실행)"""
+        return await asyncio.to_thread(self.get_order_chance, symbol)
+        
+    async def create_order_async(self, symbol: str, order_info: OrderInfo) -> OrderResult:
+        """create_order의 비동기 버전 (워커 쓰레드에서 실행)"""
+        return await asyncio.to_thread(self.create_order, symbol, order_info)
+        
+    async def get_order_async(self, order_id: str) -> OrderResult:
+        """get_order의 비동기 버전 (워커 쓰레드에서 실행)"""
+        return await asyncio.to_thread(self.get_order, order_id)
+        
+    async def cancel_order_async(self, symbol: str, order_id: str) -> Dict:
+        """cancel_order의 비동기 버전 (워커 쓰레드에서 실행)"""
+        return await asyncio.to_thread(self.cancel_order, symbol, order_id)
+
+_order_instance: Optional[TradingOrder] = None
+_order_instance_lock = threading.Lock()
+
+def get_trading_order(
+    api_key: str = None,
+    secret_key: str = None,
+    log_manager: Optional[LogManager] = None
+) -> TradingOrder:
+    """프로세스 전역에서 공유하는 TradingOrder 인스턴스를 반환합니다.
+
+    최초 호출 시에만 인스턴스를 생성하며, 이후 호출의 인자는 무시됩니다.
+
+    Args:
+        api_key (str, optional): Bithumb API 키
+        secret_key (str, optional): Bithumb Secret 키
+        log_manager (Optional[LogManager]): 로그 매니저 (선택사항)
+
+    Returns:
+        TradingOrder: 공유 TradingOrder 인스턴스
+    """
+    global _order_instance
+    with _order_instance_lock:
+        if _order_instance is None:
+            _order_instance = TradingOrder(
+                api_key=api_key,
+                secret_key=secret_key,
+                log_manager=log_manager
+            )
+        return _order_instance
@@ -1,8 +1,14 @@
 import time
 import os
+import sched
+import random
+import signal
+from collections import deque
 import uuid
+import queue
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Union, Deque
 
 from src.trading_executor import TradingExecutor
 from src.discord_notifier import DiscordNotifier
@@ -11,6 +17,9 @@ from src.trading_logger import TradingLogger
 from src.models.market_data import TradeExecutionResult
 
 class TradingScheduler:
+    # Ctrl+C 후 스케줄러 대기가 중단 여부를 확인하는 최대 간격 (초)
+    INTERRUPT_POLL_SECONDS = 1.0
+
     def __init__(
         self,
         trading_executor: TradingExecutor,
@@ -25,7 +34,7 @@ class TradingScheduler:
         Args:
             trading_executor (TradingExecutor): 트레이딩 실행기
             log_manager (LogManager): 로그 매니저
-            trading_logger (TradingLogger): 구글 시트 로거
+            trading_logger (TradingLogger): 구글 시트 로거 (get_trading_logger()로 얻은 공유 인스턴스를 전달)
             discord_notifier (Optional[DiscordNotifier], optional): Discord 알림 전송기. Defaults to None.
             dev_mode (bool, optional): 개발 모드 여부. Defaults to True.
             max_history_size (int, optional): 캐싱할 최대 히스토리 크기. Defaults to 10.
@@ -34,73 +43,205 @@ class TradingScheduler:
         self.discord_notifier = discord_notifier
         self.dev_mode = dev_mode
         self.is_running = False
-        self.next_execution_time = None
+        # 심볼별 다음 실행 시각 (로그 표시용 벽시계 시각)
+        self.next_execution_times: Dict[str, datetime] = {}
+        # 심볼별 다음 실행 시각 문자열 (예약 시 한 번만 포맷)
+        self._next_exec_strs: Dict[str, str] = {}
+        # 심볼별 실제 대기에 사용하는 단조 시계(time.monotonic) 기준 마감 시각
+        self._next_deadlines: Dict[str, float] = {}
+        # 심볼별 연속 실행 실패 횟수 (재시도 백오프 계산용)
+        self._consecutive_errors: Dict[str, int] = {}
+        # 스케줄러 틱마다 한 번 읽어 재사용하는 현재 시각
+        self._tick_now = datetime.now()
         self.log_manager = log_manager
         self.trading_logger = trading_logger
         self.max_history_size = max_history_size
         
+        # stop() 호출 시 대기 중인 스케줄러를 즉시 깨우기 위한 이벤트
+        self._stop_event = threading.Event()
+        # 단조 시계 기준 이벤트 스케줄러 (대기는 _stop_event.wait로 하므로 stop() 시 즉시 깨어남)
+        self._sched = sched.scheduler(time.monotonic, self._stop_event.wait)
+        self._interrupted = False
+        
         # 매매 판단 히스토리를 저장할 딕셔너리 (심볼별로 관리)
-        self.decision_history: Dict[str, List[TradeExecutionResult]] = {}
+        # (maxlen으로 오래된 항목이 자동으로 제거됨)
+        self.decision_history: Dict[str, Deque[TradeExecutionResult]] = {}
+        
+        # Discord 알림은 매매 루프를 막지 않도록 별도 쓰레드에서 전송
+        self._notify_q: queue.Queue = queue.Queue(maxsize=128)
+        self._notify_thread: Optional[threading.Thread] = None
+        self._ensure_notification_worker()
 
-    def _calculate_next_execution_time(self, interval_minutes: int) -> datetime:
+    def _calculate_next_execution_time(self, interval_minutes: float) -> datetime:
         """다음 실행 시간을 계산합니다.
 
+        현재 틱에서 캐시한 시각(_tick_now)을 기준으로 계산합니다.
+
         Args:
-            interval_minutes (int): 다음 실행까지의 간격 (분)
+            interval_minutes (float): 다음 실행까지의 간격 (분)
 
         Returns:
             datetime: 다음 실행 시간
         """
-        return datetime.now() + timedelta(minutes=interval_minutes)
+        return self._tick_now + timedelta(minutes=interval_minutes)
+
+    def _schedule_next(self, symbol: str, interval_minutes: float):
+        """심볼의 다음 실행 마감 시각을 설정합니다.
+
+        대기는 시스템 시각 변경(NTP 보정 등)에 영향받지 않도록 단조 시계로 하고,
+        벽시계 시각(next_execution_times)은 로그 표시용으로만 계산합니다.
+
+        Args:
+            symbol (str): 매매 심볼
+            interval_minutes (float): 다음 실행까지의 간격 (분)
+        """
+        self._next_deadlines[symbol] = time.monotonic() + interval_minutes * 60
+        next_execution_time = self._calculate_next_execution_time(interval_minutes)
+        self.next_execution_times[symbol] = next_execution_time
+        self._next_exec_strs[symbol] = f"{next_execution_time:%Y-%m-%d %H:%M:%S}"
+
+    def _error_retry_minutes(self, symbol: str) -> float:
+        """연속 실패 횟수에 따른 재시도 간격(분)을 계산합니다.
+
+        1분에서 시작해 실패할 때마다 두 배로 늘리되 15분을 넘지 않으며,
+        여러 심볼이 동시에 재시도하지 않도록 0~5초의 지터를 더합니다.
+
+        Args:
+            symbol (str): 매매 심볼
+
+        Returns:
+            float: 재시도까지의 간격 (분)
+        """
+        errors = self._consecutive_errors.get(symbol, 0) + 1
+        self._consecutive_errors[symbol] = errors
+        delay_seconds = min(900, 60 * 2 ** min(errors - 1, 10)) + random.uniform(0, 5)
+        return delay_seconds / 60
+
+    def _log_cycle_summary(self, symbol: str, action: Optional[str]):
+        """매매 사이클 한 번의 결과와 다음 실행 정보를 하나의 로그로 남깁니다.
 
-    def _wait_until_next_execution(self):
-        """다음 실행 시간까지 대기합니다."""
-        if not self.next_execution_time:
+        Args:
+            symbol (str): 매매 심볼
+            action (Optional[str]): 매매 판단 (실행 실패 시 None)
+        """
+        # 기록하지 않는 카테고리면 로그 데이터 구성 자체를 생략
+        if not self.log_manager.is_enabled(LogCategory.SYSTEM):
             return
+            
+        # 매 사이클 호출되므로 키워드 인자 대신 위치 인자로 호출
+        self.log_manager.log(
+            LogCategory.SYSTEM,
+            f"{symbol} 매매 사이클 완료",
+            {
+                "symbol": symbol,
+                "action": action,
+                "history_size": len(self.decision_history.get(symbol, ())),
+                "consecutive_errors": self._consecutive_errors.get(symbol, 0),
+                "next_execution_time": self._next_exec_strs[symbol],
+                "remaining_seconds": max(0, int(self._next_deadlines[symbol] - time.monotonic()))
+            }
+        )
 
-        while datetime.now() < self.next_execution_time:
-            remaining_seconds = (self.next_execution_time - datetime.now()).total_seconds()
-            if remaining_seconds > 0:
-                self.log_manager.log(
-                    category=LogCategory.SYSTEM,
-                    message="다음 실행 대기 중",
-                    data={"remaining_seconds": int(remaining_seconds)}
-                )
-                time.sleep(min(remaining_seconds, 60))  # 최대 1분씩 대기
+    def _ensure_notification_worker(self):
+        """알림 쓰레드가 없거나 종료되었으면 새 큐와 함께 다시 시작합니다.
+
+        stop() 이후 start()를 다시 호출해도 알림이 읽히지 않는 큐에 쌓이지 않도록 합니다.
+        """
+        if not self.discord_notifier:
+            return
+        if self._notify_thread is not None and self._notify_thread.is_alive():
+            return
+        # 이전 쓰레드가 남긴 종료 신호를 새 쓰레드가 받지 않도록 큐도 새로 만든다
+        self._notify_q = queue.Queue(maxsize=128)
+        self._notify_thread = threading.Thread(
+            target=self._notification_worker, args=(self._notify_q,), daemon=True
+        )
+        self._notify_thread.start()
+
+    def _notification_worker(self, notify_q: queue.Queue):
+        """알림 큐에서 (종류, 내용)을 꺼내 Discord로 전송합니다.
+
+        대기 중인 알림을 함께 꺼내, 연속된 에러 알림은 한 번의 요청으로 묶어 보냅니다.
+        """
+        max_batch = self.discord_notifier.MAX_EMBEDS_PER_MESSAGE
+        while True:
+            batch = [notify_q.get()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(notify_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            pending_errors: List[str] = []
+            for kind, payload in batch:
+                if kind == "error":
+                    pending_errors.append(payload)
+                    continue
+                self._send_error_notifications(pending_errors)
+                pending_errors = []
+                if kind is None:
+                    return
+                self._send_notification(kind, payload)
+            self._send_error_notifications(pending_errors)
+
+    def _send_notification(self, kind: str, payload):
+        """알림 하나를 전송합니다. 실패는 로그만 남깁니다."""
+        try:
+            if kind == "trade":
+                self.discord_notifier.send_trade_notification(result=payload)
+        except Exception as e:
+            self.log_manager.log(
+                category=LogCategory.ERROR,
+                message="Discord 알림 전송 실패",
+                data={"kind": kind, "error": str(e)}
+            )
+
+    def _send_error_notifications(self, error_messages: List[str]):
+        """모아 둔 에러 알림을 한 번에 전송합니다. 실패는 로그만 남깁니다."""
+        if not error_messages:
+            return
+        try:
+            self.discord_notifier.send_error_notifications(error_messages)
+        except Exception as e:
+            self.log_manager.log(
+                category=LogCategory.ERROR,
+                message="Discord 알림 전송 실패",
+                data={"kind": "error", "count": len(error_messages), "error": str(e)}
+            )
+
+    def _enqueue_notification(self, kind: str, payload):
+        """Discord 알림을 전송 큐에 넣습니다. 큐가 가득 차면 버립니다.
+
+        Args:
+            kind (str): 알림 종류 ("trade" 또는 "error")
+            payload: 알림 내용 (매매 결과 또는 에러 메시지)
+        """
+        if not self.discord_notifier:
+            return
+        try:
+            self._notify_q.put_nowait((kind, payload))
+        except queue.Full:
+            self.log_manager.log(
+                category=LogCategory.SYSTEM,
+                message="Discord 알림 큐가 가득 차 알림을 버립니다",
+                data={"kind": kind}
+            )
 
     def _add_to_history(self, symbol: str, result: TradeExecutionResult):
         """매매 판단 결과를 히스토리에 추가합니다.
-        관망이 아닌 실제 매매 결정만 저장합니다.
+        관망이 아닌 실제 매매 결정만 저장하며, 관망 여부는 호출자
+        (_handle_trading_result)가 미리 걸러낸다고 가정합니다.
 
         Args:
             symbol (str): 매매 심볼
-            result (TradeExecutionResult): 매매 실행 결과
+            result (TradeExecutionResult): 관망이 아닌 매매 실행 결과
         """
         try:
-            # 관망인 경우 저장하지 않음
-            if result.decision_result.decision.action == "관망":
-                return
-                
-            # 심볼에 대한 히스토리가 없으면 초기화
-            if symbol not in self.decision_history:
-                self.decision_history[symbol] = []
-                
-            # 히스토리에 추가
-            self.decision_history[symbol].append(result)
-            
-            # 최대 크기를 초과하면 가장 오래된 항목 제거
-            if len(self.decision_history[symbol]) > self.max_history_size:
-                self.decision_history[symbol].pop(0)
-                
-            if self.log_manager:
-                self.log_manager.log(
-                    category=LogCategory.SYSTEM,
-                    message=f"{symbol} 매매 판단 히스토리 추가",
-                    data={
-                        "action": result.decision_result.decision.action,
-                        "history_size": len(self.decision_history[symbol])
-                    }
-                )
+            # 히스토리에 추가 (최대 크기를 초과하면 가장 오래된 항목이 자동으로 제거됨)
+            history = self.decision_history.get(symbol)
+            if history is None:
+                history = self.decision_history[symbol] = deque(maxlen=self.max_history_size)
+            history.append(result)
                 
         except Exception as e:
             if self.log_manager:
@@ -119,7 +260,7 @@ class TradingScheduler:
         Returns:
             List[TradeExecutionResult]: 매매 판단 히스토리 목록
         """
-        return self.decision_history.get(symbol, [])
+        return list(self.decision_history.get(symbol, ()))
 
     def _handle_trading_result(
         self,
@@ -132,32 +273,26 @@ class TradingScheduler:
             symbol (str): 매매 심볼
             result (TradeExecutionResult): 매매 실행 결과
         """
+        # 관망은 가장 흔한 결과이며 히스토리/시트/알림 어디에도 기록하지 않으므로 바로 반환
+        if result.decision_result.decision.action == "관망":
+            return
+            
         try:
             # 매매 판단 히스토리에 추가
             self._add_to_history(symbol, result)
             
-            # 실행 실패 또는 관망인 경우 처리하지 않음
-            if not result.success or result.decision_result.decision.action == "관망":
-                return
-            
-            if not result.order_result:
+            # 실행 실패 또는 주문 결과가 없는 경우 처리하지 않음
+            if not result.success or not result.order_result:
                 return
                 
-            # 통합된 매매 기록
-            self.trading_logger.log_order_record(
+            # 통합된 매매 기록 (주문 기록/주문 응답/체결 내역을 시트별 한 번씩 저장)
+            self.trading_logger.log_execution_result(
                 symbol=symbol,
                 result=result
             )
-            
-            self.trading_logger.log_order_response(
-                order_result=result.order_result
-            )
 
-            # Discord 알림 전송
-            if self.discord_notifier:
-                self.discord_notifier.send_trade_notification(
-                    result=result
-                )
+            # Discord 알림 전송 (비동기)
+            self._enqueue_notification("trade", result)
             
         except Exception as e:
             self.log_manager.log(
@@ -166,65 +301,149 @@ class TradingScheduler:
             )
             raise
 
-    def _handle_error(self, error: Exception):
-        """에러를 처리합니다.
+    def _handle_error(self, symbol: str, error: Exception):
+        """매매 사이클 실행 중 발생한 에러를 처리합니다.
+
+        백오프 간격으로 다음 실행을 예약하고, 에러를 기록한 뒤 Discord로 알립니다.
 
         Args:
+            symbol (str): 매매 심볼
             error (Exception): 발생한 에러
         """
-        
+        self._tick_now = datetime.now()
+        retry_minutes = self._error_retry_minutes(symbol)
+        self._schedule_next(symbol, retry_minutes)
+        error_message = f"트레이딩 실행 중 에러 발생: {str(error)}"
+        self.log_manager.log(
+            category=LogCategory.ERROR,
+            message=error_message,
+            data={
+                "traceback": str(error),
+                "consecutive_errors": self._consecutive_errors[symbol],
+                "retry_seconds": int(retry_minutes * 60)
+            }
+        )
+
+        # Discord 에러 알림 전송 (비동기)
+        self._enqueue_notification("error", error_message)
+
+
+    def _run_trading_cycle(self, symbol: str):
+        """한 번의 매매 사이클을 실행하고 다음 사이클을 스케줄러에 등록합니다.
+
+        사이클마다 결과 요약 로그를 한 번만 남깁니다.
+
+        Args:
+            symbol (str): 매매할 심볼 (예: BTC)
+        """
+        # stop()이나 Ctrl+C 직후 큐에 남아 있던 사이클이 실행되어 주문이 나가지 않도록 막는다
+        if self._stop_event.is_set() or self._interrupted:
+            return
+        action = None
+        try:
+            # 트레이딩 실행
+            result = self.trading_executor.execute_trade(symbol)
+            self._tick_now = datetime.now()
+            action = result.decision_result.decision.action
+
+            # 0.5분 같은 소수 간격이 0으로 잘리지 않도록 float 그대로 사용
+            self._schedule_next(symbol, result.decision_result.decision.next_decision.interval_minutes)
+
+            # 결과 처리
+            self._handle_trading_result(
+                symbol=symbol,
+                result=result
+            )
+            self._consecutive_errors.pop(symbol, None)
+
+        except Exception as e:
+            self._handle_error(symbol, e)
             
+        if self.is_running and not self._stop_event.is_set():
+            self._sched.enterabs(self._next_deadlines[symbol], 1, self._run_trading_cycle, (symbol,))
+            self._log_cycle_summary(symbol, action)
 
-    def start(self, symbol: str):
+    def start(self, symbol: Union[str, List[str]]):
         """트레이딩을 시작합니다.
 
+        심볼마다 첫 사이클을 즉시 실행하도록 등록한 뒤 stop()이 호출될 때까지
+        스케줄러를 실행합니다. 여러 심볼은 하나의 스케줄러 쓰레드에서
+        각자의 간격으로 번갈아 실행됩니다.
+
         Args:
-            symbol (str): 매매할 심볼 (예: BTC)
+            symbol (Union[str, List[str]]): 매매할 심볼 또는 심볼 목록 (예: BTC, ['BTC', 'ETH'])
         """
+        symbols = [symbol] if isinstance(symbol, str) else list(symbol)
+        symbol = "_".join(symbols)
+        
         # 새로운 트레이딩 세션 시작
         self.log_manager.start_new_trading_session(symbol)
         self.log_manager.log(
             category=LogCategory.SYSTEM,
             message=f"{symbol} 자동매매 스케줄러 시작",
-            data={"dev_mode": self.dev_mode}
+            data={"symbols": symbols, "dev_mode": self.dev_mode}
         )
         
         self.is_running = True
+        self._interrupted = False
+        self._stop_event.clear()
+        self._ensure_notification_worker()
+        for target in symbols:
+            self._sched.enter(0, 1, self._run_trading_cycle, (target,))
 
-        while self.is_running:
-            try:
-                # 다음 실행 시간까지 대기
-                self._wait_until_next_execution()
+        # 첫 Ctrl+C는 예외 대신 중단 플래그로 처리 (시그널 핸들러는 메인 쓰레드에서만 설치 가능)
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGINT, self._on_sigint)
 
-                # 트레이딩 실행
-                result = self.trading_executor.execute_trade(symbol)
+        try:
+            self._run_scheduler()
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+            # 예약 큐 정리는 시그널 핸들러가 아닌 스케줄러 쓰레드에서 수행
+            self.is_running = False
+            self._cancel_pending_cycles()
 
-                interval_minutes = int(result.decision_result.decision.next_decision.interval_minutes)
-                self.next_execution_time = self._calculate_next_execution_time(interval_minutes)
+        if self._interrupted:
+            self.log_manager.log(
+                category=LogCategory.SYSTEM,
+                message=f"{symbol} 자동매매 스케줄러 종료 요청"
+            )
+            self.stop()
 
-                # 결과 처리
-                self._handle_trading_result(
-                    symbol=symbol,
-                    result=result
-                )
+    def _run_scheduler(self):
+        """중지 이벤트가 설정될 때까지 예약된 사이클을 실행합니다.
 
-            except Exception as e:
-                self.next_execution_time = self._calculate_next_execution_time(1)
-                error_message = f"트레이딩 실행 중 에러 발생: {str(e)}"
-                self.log_manager.log(
-                    category=LogCategory.ERROR,
-                    message=error_message,
-                    data={"traceback": str(e)}
-                )
-
-                # Discord 에러 알림 전송
-                self.discord_notifier.send_error_notification(error_message)
-            except KeyboardInterrupt:
-                self.log_manager.log(
-                    category=LogCategory.SYSTEM,
-                    message=f"{symbol} 자동매매 스케줄러 종료 요청"
-                )
+        sched.scheduler.run()은 중지 이벤트가 설정된 뒤에도 남은 이벤트의 마감까지
+        바쁜 대기를 하므로, 실행 가능한 이벤트만 처리하고 대기는 직접 수행합니다.
+        """
+        while not (self._stop_event.is_set() or self._interrupted):
+            delay = self._sched.run(blocking=False)
+            if delay is None:
                 break
+            # SIGINT 핸들러는 이벤트를 설정하지 않으므로 일정 간격마다 깨어나 중단 여부를 확인
+            self._stop_event.wait(min(delay, self.INTERRUPT_POLL_SECONDS))
+
+    def _on_sigint(self, signum, frame):
+        """SIGINT 수신 시 중단 플래그만 설정합니다.
+
+        실행 중인 사이클은 끝까지 마친 뒤 스케줄러 쓰레드가 예약된 사이클을 취소하고
+        종료합니다. 시그널 핸들러에서는 락을 잡는 Event.set()이나 sched 큐 조작을
+        하지 않으며, 두 번째 Ctrl+C는 KeyboardInterrupt로 즉시 중단되도록
+        기본 핸들러를 복원합니다.
+        """
+        self._interrupted = True
+        self.is_running = False
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    def _cancel_pending_cycles(self):
+        """대기 중인 사이클을 취소합니다 (이미 실행된 이벤트는 무시)."""
+        for event in self._sched.queue:
+            try:
+                self._sched.cancel(event)
+            except ValueError:
+                pass
 
     def stop(self):
         """트레이딩을 중지합니다."""
@@ -233,4 +452,16 @@ class TradingScheduler:
             message="트레이딩 중지"
         )
         self.is_running = False
+        self._stop_event.set()
+        self._cancel_pending_cycles()
+        
+        # 남은 알림을 전송한 뒤 알림 쓰레드 종료
+        if self._notify_thread:
+            try:
+                self._notify_q.put_nowait((None, None))
+                self._notify_thread.join(timeout=5)
+            except queue.Full:
+                pass
+            # 다음 start()에서 새 알림 쓰레드를 시작하도록 비운다
+            self._notify_thread = None
         self.log_manager.stop() 
\ No newline at end of file
@@ -1,40 +1,87 @@
 import os
-import json
+import sys
+import time
 import logging
 import traceback
-from queue import Queue, Empty
+import orjson
+from queue import SimpleQueue, Empty
 from threading import Thread
 from datetime import datetime
-from typing import Dict, Optional, List, Any
-from dataclasses import dataclass, asdict
+from decimal import Decimal
+from typing import Dict, Optional, List, Any, Iterable
+from dataclasses import dataclass, field
 
-class DateTimeEncoder(json.JSONEncoder):
-    """datetime 객체를 JSON으로 직렬화하기 위한 인코더"""
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.strftime("%Y-%m-%d %H:%M:%S")
-        return super().default(obj)
+# 로그 시각 표시 형식
+_DT_FMT = "%Y-%m-%d %H:%M:%S"
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson이 직접 직렬화하지 않는 객체를 변환합니다.
+
+    datetime은 기존 형식 문자열로, Decimal은 문자열로, float 하위 클래스와
+    numpy 스칼라(np.float64 등)는 파이썬 기본 숫자로 변환합니다.
+    """
+    if isinstance(obj, datetime):
+        return obj.strftime(_DT_FMT)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    item = getattr(obj, 'item', None)
+    if callable(item):
+        return item()
+    raise TypeError
+
+# 로그 한 줄 직렬화 옵션 (datetime은 기존 형식을 유지하도록 _orjson_default에서 처리)
+_ORJSON_OPTS = (
+    orjson.OPT_APPEND_NEWLINE
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_SERIALIZE_NUMPY
+)
 
 @dataclass
 class LogEntry:
     """로그 엔트리 데이터 클래스"""
-    timestamp: str
+    timestamp: float  # epoch 초 (기록 시 문자열로 변환)
     category: str
     message: str
     data: Optional[Dict] = None
     stacktrace: Optional[List[str]] = None
+    # 워커 쓰레드에서 stacktrace로 변환할 예외 정보 (sys.exc_info() 결과)
+    exc_info: Optional[tuple] = field(default=None, repr=False)
+
+    def resolve_stacktrace(self):
+        """보관한 예외 정보를 문자열 스택트레이스로 변환합니다."""
+        if self.exc_info is not None:
+            self.stacktrace = traceback.format_exception(*self.exc_info)
+            self.exc_info = None
 
     def to_dict(self) -> Dict:
-        """로그 엔트리를 딕셔너리로 변환"""
-        return asdict(self)
+        """로그 엔트리를 딕셔너리로 변환
+
+        data는 복사하지 않고 그대로 참조하므로, 반환값을 즉시 직렬화하는 용도로만 사용합니다.
+        """
+        self.resolve_stacktrace()
+        return {
+            "timestamp": time.strftime(_DT_FMT, time.localtime(self.timestamp)),
+            "category": self.category,
+            "message": self.message,
+            "data": self.data,
+            "stacktrace": self.stacktrace
+        }
 
 class LogCategory:
     """로그 카테고리"""
     SYSTEM = "SYSTEM"         # 시스템 관련
     ERROR = "ERROR"          # 오류
+    WARNING = "WARNING"      # 경고
     API = "API"              # API 호출
     TRADE = "TRADE"          # 거래 실행
+    TRADING = "TRADING"      # 매매 기록
+    DECISION = "DECISION"    # 매매 판단
+    ASSET = "ASSET"          # 자산 정보
     MARKET = "MARKET"        # 시장 데이터
+    DISCORD = "DISCORD"      # Discord 알림
     MONITOR = "MONITOR"      # 주문 모니터링
     MONITOR_STATE = "MONITOR_STATE"    # 모니터링 상태 변경
     MONITOR_ERROR = "MONITOR_ERROR"    # 모니터링 오류
@@ -42,16 +89,29 @@ class LogCategory:
 class LogManager:
     """로깅 관리자"""
     
-    def __init__(self, base_dir: str = "logs/trading_sessions"):
+    # 워커 쓰레드가 한 번에 모아서 기록하는 최대 로그 수
+    WRITE_BATCH_SIZE = 256
+    
+    def __init__(
+        self,
+        base_dir: str = "logs/trading_sessions",
+        disabled_categories: Optional[Iterable[str]] = None,
+        verbose_errors: bool = False
+    ):
         """
         Args:
             base_dir (str): 로그 파일이 저장될 기본 디렉토리 경로
+            disabled_categories (Optional[Iterable[str]]): 기록하지 않을 로그 카테고리 목록
+            verbose_errors (bool): 처리 중인 예외가 없는 ERROR 로그에도 호출 스택을 기록할지 여부
         """
         self.base_dir = base_dir
+        self.disabled_categories = set(disabled_categories or ())
+        self.verbose_errors = verbose_errors
         self.current_log_file: Optional[str] = None
-        self.log_queue = Queue()
+        self.log_queue: SimpleQueue = SimpleQueue()
         self.is_running = False
         self.logging_thread: Optional[Thread] = None
+        self._log_fd: Optional[int] = None  # 세션 동안 열어두는 로그 파일 디스크립터 (O_APPEND)
         
         # 로거 설정
         self.logger = logging.getLogger('log_manager')
@@ -99,6 +159,8 @@ class LogManager:
     
     def start_logging_thread(self):
         """로깅 쓰레드를 시작합니다."""
+        if self.current_log_file:
+            self._log_fd = os.open(self.current_log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
         self.is_running = True
         self.logging_thread = Thread(target=self._logging_worker, daemon=True)
         self.logging_thread.start()
@@ -110,8 +172,24 @@ class LogManager:
             self.is_running = False
             if self.logging_thread:
                 self.logging_thread.join()
+            if self._log_fd is not None:
+                os.close(self._log_fd)
+                self._log_fd = None
             self.logger.info("로깅 쓰레드 종료됨")
     
+    def is_enabled(self, category: str) -> bool:
+        """해당 카테고리의 로그가 기록되는지 확인합니다.
+
+        로그 데이터 생성 비용이 큰 경우 호출 전에 확인하는 용도로 사용합니다.
+
+        Args:
+            category (str): 로그 카테고리
+
+        Returns:
+            bool: 기록 여부
+        """
+        return category not in self.disabled_categories
+    
     def log(self, category: str, message: str, data: Dict = None):
         """로그를 큐에 추가합니다.
 
@@ -120,51 +198,85 @@ class LogManager:
             message (str): 로그 메시지
             data (Dict, optional): 추가 데이터. Defaults to None.
         """
+        if category in self.disabled_categories:
+            return
+        
         try:
             stacktrace = None
+            exc_info = None
             if category == LogCategory.ERROR:
-                stacktrace = traceback.format_stack()[:-1]  # 현재 함수 호출은 제외
+                # 처리 중인 예외가 있으면 정보만 보관하고 문자열 변환은 워커 쓰레드에서 수행
+                exc_info = sys.exc_info()
+                if exc_info[0] is None:
+                    exc_info = None
+                    if self.verbose_errors:
+                        stacktrace = traceback.format_stack()[:-1]  # 현재 함수 호출은 제외
             
             log_entry = LogEntry(
-                timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                timestamp=time.time(),
                 category=category,
                 message=message,
                 data=data,
-                stacktrace=stacktrace
+                stacktrace=stacktrace,
+                exc_info=exc_info
             )
             self.log_queue.put(log_entry)
             
         except Exception as e:
             self.logger.error(f"로그 추가 실패: {str(e)}")
     
+    def _drain_queue(self, batch: List[LogEntry]) -> List[LogEntry]:
+        """큐에 쌓인 로그를 WRITE_BATCH_SIZE까지 기다리지 않고 꺼내 batch에 추가합니다."""
+        while len(batch) < self.WRITE_BATCH_SIZE:
+            try:
+                batch.append(self.log_queue.get_nowait())
+            except Empty:
+                break
+        return batch
+    
     def _logging_worker(self):
-        """로그 큐에서 로그를 가져와서 파일에 기록하는 워커 쓰레드"""
+        """로그 큐에서 로그를 모아서 파일에 기록하는 워커 쓰레드"""
         while self.is_running:
             try:
-                # 1초 타임아웃으로 큐에서 로그 가져오기
-                log_entry = self.log_queue.get(timeout=1)
-                self._write_log(log_entry)
-                self.log_queue.task_done()
+                # 1초 타임아웃으로 첫 로그를 기다린 뒤 쌓여 있는 로그를 함께 가져오기
+                batch = self._drain_queue([self.log_queue.get(timeout=1)])
+                self._write_logs(batch)
                 
             except Empty:
                 continue
             except Exception as e:
                 self.logger.error(f"로그 처리 중 오류 발생: {str(e)}")
+        
+        # 종료 전 남은 로그 기록
+        batch = self._drain_queue([])
+        while batch:
+            self._write_logs(batch)
+            batch = self._drain_queue([])
     
-    def _write_log(self, log_entry: LogEntry):
-        """로그를 파일에 기록합니다.
+    def _write_logs(self, log_entries: List[LogEntry]):
+        """로그 묶음을 한 번의 write 시스템 콜로 파일에 기록합니다.
+
+        O_APPEND로 연 디스크립터에 직접 쓰므로 파이썬 파일 객체의 버퍼링을 거치지 않습니다.
 
         Args:
-            log_entry (LogEntry): 기록할 로그 엔트리
+            log_entries (List[LogEntry]): 기록할 로그 엔트리 목록
         """
-        if not self.current_log_file:
+        if self._log_fd is None:
             self.logger.error("현재 로그 파일이 설정되지 않았습니다.")
             return
         
+        lines = []
+        for log_entry in log_entries:
+            try:
+                lines.append(orjson.dumps(log_entry.to_dict(), default=_orjson_default, option=_ORJSON_OPTS))
+            except Exception as e:
+                self.logger.error(f"로그 직렬화 실패: {str(e)}")
+        
         try:
-            with open(self.current_log_file, 'a', encoding='utf-8') as f:
-                json.dump(log_entry.to_dict(), f, ensure_ascii=False, cls=DateTimeEncoder)
-                f.write('\n')
+            # 부분 쓰기가 발생하면 남은 부분을 이어서 기록
+            view = memoryview(b''.join(lines))
+            while view:
+                view = view[os.write(self._log_fd, view):]
                 
         except Exception as e:
             self.logger.error(f"로그 파일 쓰기 실패: {str(e)}")
@@ -3,28 +3,36 @@ import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-def setup_logger(name: str) -> logging.Logger:
+def setup_logger(name: str, console_level: int = logging.INFO) -> logging.Logger:
     """로거를 설정합니다.
     
+    같은 이름으로 여러 번 호출해도 핸들러는 한 번만 추가됩니다.
+    
     Args:
         name: 로거 이름
+        console_level: 콘솔 출력 최소 레벨 (운영 환경에서는 logging.WARNING 권장)
         
     Returns:
         설정된 로거
     """
     # 로거 생성
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.DEBUG)
+    # 루트 로거 핸들러에서 같은 레코드를 다시 처리하지 않도록 전파 차단
+    logger.propagate = False
     
     # 포맷터 생성
     formatter = logging.Formatter(
-        '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        '{asctime} [{levelname}] {name}: {message}',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        style='{'
     )
     
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(console_level)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
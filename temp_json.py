@@ -1,4 +1,5 @@
-import json
+import re
+import orjson
 
 # 서버에서 받은 문자열
 raw_str = '''```json
@@ -41,6 +42,9 @@ raw_str = '''```json
 }
 ```'''
 
+# 응답 앞뒤의 마크다운 코드 펜스 (```json ... ```)
+_FENCE_RE = re.compile(r'\A```(?:json)?|```\Z')
+
 def parse_json_from_markdown(markdown_str: str) -> dict:
     """마크다운 코드 블록에서 JSON을 파싱합니다.
 
@@ -50,21 +54,14 @@ def parse_json_from_markdown(markdown_str: str) -> dict:
     Returns:
         dict: 파싱된 JSON 데이터
     """
-    # 1. 마크다운 코드 블록 제거
-    json_str = markdown_str.strip()
-    if json_str.startswith("```json"):
-        json_str = json_str[7:]  # "```json" 제거
-    if json_str.endswith("```"):
-        json_str = json_str[:-3]  # "```" 제거
-    
-    # 2. 문자열 앞뒤의 공백 제거
-    json_str = json_str.strip()
+    # 1. 마크다운 코드 블록 제거 후 앞뒤 공백 제거
+    json_str = _FENCE_RE.sub('', markdown_str.strip()).strip()
     
-    # 3. JSON 파싱
+    # 2. JSON 파싱
     try:
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return data
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"JSON 파싱 실패: {e}")
         return None
 
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+from src import discord_notifier
+from src.discord_notifier import DiscordNotifier
+
+
+class FakeLogManager:
+    def log(self, category, message, data=None):
+        pass
+
+
+class RateLimitedSession:
+    def __init__(self, headers, body):
+        self.headers = headers
+        self.body = body
+        self.posts = 0
+
+    def post(self, url, data):
+        self.posts += 1
+        return SimpleNamespace(
+            status_code=429,
+            headers=self.headers,
+            json=lambda: self.body,
+            text="rate limited"
+        )
+
+
+def _notifier(session):
+    notifier = DiscordNotifier("https://discord.invalid/webhook", FakeLogManager())
+    notifier.session = session
+    return notifier
+
+
+def test_rate_limit_wait_is_clamped_and_skipped_after_last_attempt(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(discord_notifier.time, "sleep", sleeps.append)
+    session = RateLimitedSession(headers={}, body={"retry_after": 3600})
+
+    response = _notifier(session)._send_message("hello")
+
+    assert response.status_code == 429
+    assert session.posts == DiscordNotifier.MAX_RATE_LIMIT_RETRIES + 1
+    assert sleeps == [DiscordNotifier.MAX_RETRY_AFTER_SECONDS] * DiscordNotifier.MAX_RATE_LIMIT_RETRIES
+
+
+def test_retry_after_header_is_preferred_over_body():
+    notifier = _notifier(RateLimitedSession(headers={}, body={}))
+    response = SimpleNamespace(headers={"Retry-After": "0.5"}, json=lambda: {"retry_after": 4})
+
+    assert notifier._retry_after_seconds(response) == 0.5
@@ -0,0 +1,42 @@
+import glob
+import os
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+
+from src.utils.log_manager import LogManager, LogCategory
+
+
+class Float64(float):
+    """numpy.float64처럼 float을 상속한 숫자 타입"""
+
+
+def _read_entries(log_dir):
+    [log_file] = glob.glob(os.path.join(log_dir, "*.log"))
+    with open(log_file, "rb") as f:
+        return [orjson.loads(line) for line in f.read().splitlines()]
+
+
+def test_float_subclass_values_are_logged(tmp_path):
+    log_manager = LogManager(base_dir=str(tmp_path))
+    log_manager.start_new_trading_session("BTC")
+    log_manager.log(
+        LogCategory.MARKET,
+        "시장 분석 완료",
+        {
+            "vwap_3m": Float64(123.5),
+            "price": Decimal("1.25"),
+            "at": datetime(2024, 1, 2, 3, 4, 5)
+        }
+    )
+    log_manager.stop()
+
+    entries = _read_entries(str(tmp_path))
+    market = [entry for entry in entries if entry["category"] == LogCategory.MARKET]
+    assert len(market) == 1
+    assert market[0]["data"] == {
+        "vwap_3m": 123.5,
+        "price": "1.25",
+        "at": "2024-01-02 03:04:05"
+    }
@@ -0,0 +1,70 @@
+from decimal import Decimal
+
+from src.models.order import OrderResult, Trade
+
+
+def test_order_result_from_dict_treats_null_amounts_as_zero():
+    order_result = OrderResult.from_dict({
+        "uuid": "order-1",
+        "side": "bid",
+        "ord_type": "price",
+        "state": "done",
+        "market": "KRW-BTC",
+        "created_at": "2024-01-02T03:04:05+09:00",
+        "trades_count": 1,
+        "paid_fee": None,
+        "executed_volume": "0.001",
+        "price": "10000",
+        "trades": [
+            {
+                "market": "KRW-BTC",
+                "uuid": "trade-1",
+                "price": "10000000",
+                "volume": "0.001",
+                "funds": None,
+                "side": "bid",
+                "created_at": "2024-01-02T03:04:05+09:00"
+            }
+        ]
+    })
+
+    assert order_result is not None
+    assert order_result.paid_fee == Decimal(0)
+    assert order_result.executed_volume == Decimal("0.001")
+    assert order_result.price == Decimal("10000")
+    assert order_result.volume is None
+    assert len(order_result.trades) == 1
+    assert order_result.trades[0].funds == Decimal(0)
+    assert order_result.trades[0].price == Decimal("10000000")
+
+
+def test_trade_from_dict_defaults_missing_amounts_to_zero():
+    trade = Trade.from_dict({"market": "KRW-BTC", "uuid": "trade-1"})
+
+    assert trade is not None
+    assert (trade.price, trade.volume, trade.funds) == (Decimal(0), Decimal(0), Decimal(0))
+
+
+def test_order_result_from_dict_skips_only_invalid_trades():
+    valid_trade = {
+        "market": "KRW-BTC",
+        "uuid": "trade-1",
+        "price": "10000000",
+        "volume": "0.001",
+        "funds": "10000",
+        "side": "bid",
+        "created_at": "2024-01-02T03:04:05+09:00"
+    }
+    order_result = OrderResult.from_dict({
+        "uuid": "order-1",
+        "side": "bid",
+        "ord_type": "price",
+        "state": "done",
+        "market": "KRW-BTC",
+        "created_at": "2024-01-02T03:04:05+09:00",
+        "trades": [valid_trade, None, dict(valid_trade, uuid="trade-2", price="abc")]
+    })
+
+    assert order_result is not None
+    assert [trade.uuid for trade in order_result.trades] == ["trade-1"]
+    assert order_result.trades[0].funds == Decimal("10000")
@@ -0,0 +1,124 @@
+import hashlib
+from urllib.parse import urlencode
+
+import jwt
+import pytest
+
+from src import trading_order
+from src.models.market_data import OrderInfo
+from src.trading_order import TradingOrder, _encode_query, get_trading_order
+
+SECRET_KEY = "s" * 32
+
+
+def test_get_trading_order_returns_shared_instance(monkeypatch):
+    monkeypatch.setattr(trading_order, "_order_instance", None)
+
+    first = get_trading_order(api_key="access", secret_key=SECRET_KEY)
+    second = get_trading_order(api_key="other", secret_key="other-secret")
+
+    assert first is second
+    assert first.api_key == "access"
+
+
+def test_missing_secret_key_fails_fast(monkeypatch):
+    monkeypatch.delenv("BITHUMB_SECRET_KEY", raising=False)
+
+    with pytest.raises(ValueError):
+        TradingOrder(api_key="access", secret_key="")
+
+
+def test_auth_token_is_valid_hs256_jwt():
+    params = {"market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "10000"}
+    order = TradingOrder(api_key="access", secret_key=SECRET_KEY)
+
+    scheme, token = order._create_auth_token(params).split(" ")
+    payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+
+    assert scheme == "Bearer"
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    assert payload["access_key"] == "access"
+    assert payload["query_hash"] == hashlib.sha512(urlencode(params).encode()).hexdigest()
+    assert payload["query_hash_alg"] == "SHA512"
+
+
+def test_auth_token_nonce_is_unique_per_request():
+    order = TradingOrder(api_key="access", secret_key=SECRET_KEY)
+
+    nonces = {
+        jwt.decode(order._create_auth_token({})[len("Bearer "):], SECRET_KEY, algorithms=["HS256"])["nonce"]
+        for _ in range(100)
+    }
+
+    assert len(nonces) == 100
+
+
+@pytest.mark.parametrize("params", [
+    {"market": "KRW-BTC", "side": "ask", "ord_type": "limit", "price": "1,000", "volume": "0.5"},
+    {"uuid": "a b/c?d=e&f"},
+    {"market": "KRW-BTC", "states[]": "wait"},
+    {},
+])
+def test_encode_query_matches_urlencode(params):
+    assert _encode_query(params) == urlencode(params).encode()
+
+
+class FakeChanceApi:
+    def __init__(self, order):
+        self.order = order
+        self.chance_calls = 0
+
+    def __call__(self, method, endpoint, params):
+        if endpoint == self.order._urls['chance']:
+            self.chance_calls += 1
+            return {"bid_account": {"balance": str(self.chance_calls)}}
+        if endpoint == self.order._urls['create']:
+            return {
+                "uuid": "order-1",
+                "side": params["side"],
+                "ord_type": params["ord_type"],
+                "state": "wait",
+                "market": params["market"],
+                "created_at": "2024-01-02T03:04:05+09:00"
+            }
+        return {"status": "0000", "data": {}}
+
+
+def _order_with_fake_api(monkeypatch):
+    order = TradingOrder(api_key="access", secret_key=SECRET_KEY)
+    api = FakeChanceApi(order)
+    monkeypatch.setattr(order, "_request_json", api)
+    return order, api
+
+
+def test_order_chance_is_cached_and_returned_as_copy(monkeypatch):
+    order, api = _order_with_fake_api(monkeypatch)
+
+    first = order.get_order_chance("BTC")
+    first["bid_account"]["balance"] = "changed"
+    second = order.get_order_chance("BTC")
+
+    assert api.chance_calls == 1
+    assert second == {"bid_account": {"balance": "1"}}
+
+
+def test_create_order_invalidates_order_chance(monkeypatch):
+    order, api = _order_with_fake_api(monkeypatch)
+    order.get_order_chance("BTC")
+    order.get_order_chance("ETH")
+
+    order.create_order("BTC", OrderInfo(side="bid", order_type="price", price=10000, volume=None, krw_amount=10000))
+
+    assert order.get_order_chance("BTC") == {"bid_account": {"balance": "3"}}
+    assert order.get_order_chance("ETH") == {"bid_account": {"balance": "2"}}
+    assert api.chance_calls == 3
+
+
+def test_cancel_order_invalidates_order_chance(monkeypatch):
+    order, api = _order_with_fake_api(monkeypatch)
+    order.get_order_chance("BTC")
+
+    order.cancel_order("BTC", "order-1")
+    order.get_order_chance("BTC")
+
+    assert api.chance_calls == 2
@@ -0,0 +1,115 @@
+import os
+import signal
+import threading
+import time
+from types import SimpleNamespace
+
+from src.trading_scheduler import TradingScheduler
+
+
+class FakeLogManager:
+    def __init__(self):
+        self.messages = []
+
+    def log(self, category, message, data=None):
+        self.messages.append(message)
+
+    def is_enabled(self, category):
+        return True
+
+    def start_new_trading_session(self, symbol):
+        pass
+
+    def stop(self):
+        pass
+
+
+class FakeExecutor:
+    def __init__(self, interval_minutes):
+        self.interval_minutes = interval_minutes
+        self.calls = 0
+
+    def execute_trade(self, symbol):
+        self.calls += 1
+        decision = SimpleNamespace(
+            action="관망",
+            next_decision=SimpleNamespace(interval_minutes=self.interval_minutes),
+        )
+        return SimpleNamespace(decision_result=SimpleNamespace(decision=decision))
+
+
+def _start_in_thread(scheduler, symbol):
+    thread = threading.Thread(target=scheduler.start, args=(symbol,), daemon=True)
+    thread.start()
+    return thread
+
+
+def test_stop_wakes_waiting_scheduler():
+    executor = FakeExecutor(interval_minutes=10)
+    scheduler = TradingScheduler(executor, FakeLogManager(), trading_logger=None)
+
+    thread = _start_in_thread(scheduler, "BTC")
+    time.sleep(0.1)
+    scheduler.stop()
+    thread.join(timeout=1)
+
+    assert not thread.is_alive()
+    assert executor.calls == 1
+
+
+def test_stop_racing_with_rearm_does_not_run_another_cycle():
+    executor = FakeExecutor(interval_minutes=0.02)
+    scheduler = TradingScheduler(executor, FakeLogManager(), trading_logger=None)
+
+    # 재등록 조건 확인 직후 stop()이 끝난 상황을 재현
+    enterabs = scheduler._sched.enterabs
+
+    def stop_then_enterabs(*args, **kwargs):
+        scheduler.stop()
+        return enterabs(*args, **kwargs)
+
+    scheduler.is_running = True
+    scheduler._stop_event.clear()
+    scheduler._sched.enter(0, 1, scheduler._run_trading_cycle, ("BTC",))
+    scheduler._sched.enterabs = stop_then_enterabs
+
+    started = time.monotonic()
+    scheduler._run_scheduler()
+
+    assert time.monotonic() - started < 0.5
+    assert executor.calls == 1
+
+
+def test_cycle_after_stop_is_skipped():
+    executor = FakeExecutor(interval_minutes=10)
+    scheduler = TradingScheduler(executor, FakeLogManager(), trading_logger=None)
+    scheduler.stop()
+
+    scheduler._run_trading_cycle("BTC")
+
+    assert executor.calls == 0
+
+
+def test_sigint_stops_scheduler_and_restores_default_handler():
+    executor = FakeExecutor(interval_minutes=10)
+    scheduler = TradingScheduler(executor, FakeLogManager(), trading_logger=None)
+    previous_handler = signal.getsignal(signal.SIGINT)
+    handlers_after_sigint = []
+
+    def interrupt():
+        os.kill(os.getpid(), signal.SIGINT)
+
+    def record_handler(*args):
+        handlers_after_sigint.append(signal.getsignal(signal.SIGINT))
+
+    threading.Timer(0.1, interrupt).start()
+    threading.Timer(0.3, record_handler).start()
+    started = time.monotonic()
+    scheduler.start("BTC")
+
+    assert time.monotonic() - started < 2
+    assert executor.calls == 1
+    assert scheduler._sched.empty()
+    # 첫 Ctrl+C 이후에는 두 번째 Ctrl+C가 KeyboardInterrupt를 일으키도록 기본 핸들러로 복원
+    assert handlers_after_sigint == [signal.default_int_handler]
+    assert signal.getsignal(signal.SIGINT) is previous_handler